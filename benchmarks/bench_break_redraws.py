@@ -0,0 +1,151 @@
+"""Benchmark of Tk redraw operations per break with full and light break window
+
+Break window is simulated without Tk: snapshots of each second of break are rendered and the window
+is shown and hidden by BreakCountdownDisplay used by WndBreak, fades are run with real timing.
+Each counted operation is a redraw, which remote session sends to client: change of widget value,
+change of window transparency or full screen background. The benchmark exits with 1 if light mode
+needs more than MAX_LIGHT_TO_FULL_RATIO of redraws of full mode.
+
+Command to run from the project root:
+    python ./benchmarks/bench_break_redraws.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import dataclasses
+import datetime
+import time
+
+from settings import SystemSettingsData
+from states import ModelSnapshot, StepType
+from windows.animation import FadeAnimation
+from windows.break_countdown import BreakCountdownDisplay
+from windows.render import WidgetRenderer
+
+MODES = ("full", "light")
+MAX_LIGHT_TO_FULL_RATIO = 0.2
+
+
+class FakeWnd:
+    """Window, which counts changes of transparency and runs after() callbacks with real delays"""
+
+    def __init__(self):
+        self.alpha_changes_count = 0
+        self.callbacks: list[tuple[int, object]] = []
+
+    def attributes(self, name, value):
+        self.alpha_changes_count += 1
+
+    def after(self, delay_ms, callback):
+        self.callbacks.append((delay_ms, callback))
+        return f"after#{len(self.callbacks)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run_callbacks(self):
+        while self.callbacks:
+            delay_ms, callback = self.callbacks.pop(0)
+            time.sleep(delay_ms / 1000)
+            callback()
+
+
+class FakeWidget:
+    def set(self, value):
+        pass
+
+
+def make_break_snapshots(break_duration_min: int) -> list[ModelSnapshot]:
+    """Snapshots published by model every second of break while break window is shown"""
+    step_duration = datetime.timedelta(minutes=break_duration_min)
+    snapshot = ModelSnapshot(
+        step_type=StepType.break_mode,
+        step_duration=step_duration,
+        step_elapsed_time=datetime.timedelta(0),
+        step_remaining_time=step_duration,
+        time_until_break=datetime.timedelta(0),
+        work_progress=1,
+        protection_status="on",
+        work_duration=45,
+        break_duration=break_duration_min,
+        sounds="on",
+        notifications="on",
+        light_break_window="off",
+    )
+    return [
+        dataclasses.replace(
+            snapshot,
+            step_elapsed_time=datetime.timedelta(seconds=elapsed_s),
+            step_remaining_time=step_duration - datetime.timedelta(seconds=elapsed_s),
+        )
+        for elapsed_s in range(break_duration_min * 60)
+    ]
+
+
+def simulate_break(mode: str, snapshots: list[ModelSnapshot], update_interval_s: int) -> dict[str, int]:
+    wnd = FakeWnd()
+    renderer = WidgetRenderer(f"wnd_break_{mode}")
+    display = BreakCountdownDisplay(wnd, renderer, FakeWidget(), FakeWidget(), update_interval_s)
+    display.light_mode = mode == "light"
+
+    display.show()
+    wnd.run_callbacks()
+    for snapshot in snapshots:
+        display.render(snapshot)
+    display.hide(on_hidden=lambda: None)
+    wnd.run_callbacks()
+
+    return {
+        "widgets": renderer.applied_count,
+        "alpha": wnd.alpha_changes_count,
+        "background": 1 if display.shows_background else 0,
+    }
+
+
+def run(break_duration_min: int, update_interval_s: int) -> bool:
+    """Printing redraws of both modes, return False if light mode does not reduce them enough"""
+    system_settings = SystemSettingsData()
+    FadeAnimation.configure(
+        enabled=True,
+        duration_ms=system_settings.fade_animation_duration_ms,
+        frame_interval_ms=system_settings.fade_animation_frame_interval_ms,
+    )
+    snapshots = make_break_snapshots(break_duration_min)
+
+    print(f"break: {break_duration_min} min, update interval of light window: {update_interval_s} s")
+    print(
+        f"{'mode':>6} | {'widget updates':>14} | {'alpha changes':>13} | {'backgrounds':>11} | {'total':>6}"
+    )
+    totals = {}
+    for mode in MODES:
+        counts = simulate_break(mode, snapshots, update_interval_s)
+        totals[mode] = sum(counts.values())
+        print(
+            f"{mode:>6} | {counts['widgets']:>14} | {counts['alpha']:>13} | "
+            f"{counts['background']:>11} | {totals[mode]:>6}"
+        )
+
+    ratio = totals["light"] / totals["full"]
+    print(f"light/full: {ratio:.3f}, allowed: {MAX_LIGHT_TO_FULL_RATIO}")
+    return ratio <= MAX_LIGHT_TO_FULL_RATIO
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--break-duration", type=int, default=15, help="duration of break in minutes")
+    parser.add_argument(
+        "--update-interval",
+        type=int,
+        default=SystemSettingsData().light_break_window_update_interval_s,
+        help="update interval of light break window in seconds",
+    )
+    args = parser.parse_args()
+
+    if not run(args.break_duration, args.update_interval):
+        print("Light break window does not reduce redraws enough")
+        sys.exit(1)
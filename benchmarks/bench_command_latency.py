@@ -0,0 +1,90 @@
+"""Benchmark of latency from user action to state change: commands posted to running controller
+
+Controller runtime runs in a separate thread with real clock and waits for the next deadline,
+the main thread posts commands like buttons of windows do and waits until the view receives new step.
+Shutdown latency of controller runtime is measured at the end.
+
+Command to run from the project root:
+    python ./benchmarks/bench_command_latency.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from controller import Controller
+from model import Model
+from states import ModelSnapshot, StepType
+from view_protocol import NullView
+
+
+class StepWaitingView(NullView):
+    """View, which notifies the waiting thread when the snapshot with expected step is published"""
+
+    def __init__(self):
+        super().__init__()
+        self.expected_step_type: StepType | None = None
+        self.step_changed_event = threading.Event()
+
+    def __check_step(self, snapshot: ModelSnapshot) -> None:
+        if snapshot.step_type == self.expected_step_type:
+            self.step_changed_event.set()
+
+    def update_wnd_status(self, snapshot: ModelSnapshot) -> None:
+        self.__check_step(snapshot)
+
+    def update_wnd_break(self, snapshot: ModelSnapshot) -> None:
+        self.__check_step(snapshot)
+
+
+def run(actions_count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        view = StepWaitingView()
+        controller = Controller()
+        model = Model(settings_file=str(Path(tmp_dir) / "settings.json"), clock=controller.clock)
+        controller.set_model(model)
+        model.set_view(view)
+        controller.start()
+        # let controller runtime start waiting for the deadline
+        time.sleep(0.1)
+
+        latencies_us = []
+        for i in range(actions_count):
+            new_step_type = StepType.break_mode if i % 2 == 0 else StepType.work_mode
+            view.step_changed_event.clear()
+            view.expected_step_type = new_step_type
+            start_time_ns = time.perf_counter_ns()
+            controller.set_step(new_step_type)
+            if not view.step_changed_event.wait(timeout=5):
+                raise TimeoutError(f"Step {new_step_type.name} was not set")
+            latencies_us.append((time.perf_counter_ns() - start_time_ns) / 1000)
+        is_stopped = controller.stop()
+
+    latencies_us.sort()
+    print(f"actions: {actions_count}")
+    print(f"{'latency':>8} | {'us':>8}")
+    print(f"{'min':>8} | {latencies_us[0]:>8.1f}")
+    print(f"{'median':>8} | {statistics.median(latencies_us):>8.1f}")
+    print(f"{'p99':>8} | {latencies_us[int(len(latencies_us) * 0.99)]:>8.1f}")
+    print(f"{'max':>8} | {latencies_us[-1]:>8.1f}")
+    if is_stopped:
+        print(f"shutdown latency: {controller.runtime.shutdown_latency_s * 1e6:.1f} us")
+    else:
+        print("controller runtime is not stopped in time")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--actions", type=int, default=1000, help="number of posted actions")
+    args = parser.parse_args()
+
+    run(args.actions)
@@ -0,0 +1,103 @@
+"""Microbenchmark of current state tick: time and memory allocated per tick
+
+"before" - state with timedelta arithmetic, which creates timedelta objects on each tick,
+"after" - CurrentState with integer nanoseconds, where timedelta is created only for displaying.
+Each tick updates elapsed time and reads precise remaining and elapsed times, like model waiting loop does.
+Allocated memory is the peak of traced memory inside of tick, so objects freed in the tick are counted too.
+
+Command to run from the project root:
+    python ./benchmarks/bench_current_state.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import datetime
+import time
+import tracemalloc
+
+from clock import VirtualClock
+from states import CurrentState, StepType
+
+
+class TimedeltaCurrentState:
+    """Reference state with timedelta arithmetic on each tick"""
+
+    def __init__(self, clock: VirtualClock):
+        self.__clock = clock
+        self.__step_duration_dt = datetime.timedelta(seconds=0)
+        self.__elapsed_time_dt = datetime.timedelta(seconds=0)
+        self.__step_start_time_s = clock.now()
+        self.__elapsed_time_s = 0.0
+
+    @property
+    def current_step_elapsed_time_s(self) -> float:
+        return self.__elapsed_time_s
+
+    @property
+    def current_step_remaining_time_s(self) -> float:
+        return self.__step_duration_dt.total_seconds() - self.__elapsed_time_s
+
+    def set_current_step_data(self, step_type: StepType, step_duration: datetime.timedelta) -> None:
+        self.__step_duration_dt = step_duration
+
+    def update_elapsed_time(self) -> None:
+        self.__elapsed_time_s = self.__clock.now() - self.__step_start_time_s
+        self.__elapsed_time_dt = datetime.timedelta(seconds=int(self.__elapsed_time_s))
+
+
+def make_states() -> dict:
+    states = {}
+    for name, state_class in (("before", TimedeltaCurrentState), ("after", CurrentState)):
+        clock = VirtualClock(start_time_s=1e6)
+        state = state_class(clock)
+        state.set_current_step_data(StepType.work_mode, datetime.timedelta(days=7))
+        states[name] = (state, clock)
+    return states
+
+
+def bench_time(state, clock: VirtualClock, ticks_count: int) -> float:
+    """Return time per tick in nanoseconds"""
+    start_time_ns = time.perf_counter_ns()
+    for _ in range(ticks_count):
+        clock.advance(1)
+        state.update_elapsed_time()
+        state.current_step_remaining_time_s
+        state.current_step_elapsed_time_s
+    return (time.perf_counter_ns() - start_time_ns) / ticks_count
+
+
+def bench_memory(state, clock: VirtualClock, ticks_count: int) -> float:
+    """Return allocated bytes per tick"""
+    allocated_b = 0
+    tracemalloc.start()
+    for _ in range(ticks_count):
+        clock.advance(1)
+        tracemalloc.reset_peak()
+        memory_b, _ = tracemalloc.get_traced_memory()
+        state.update_elapsed_time()
+        state.current_step_remaining_time_s
+        state.current_step_elapsed_time_s
+        allocated_b += tracemalloc.get_traced_memory()[1] - memory_b
+    tracemalloc.stop()
+    return allocated_b / ticks_count
+
+
+def run(ticks_count: int) -> None:
+    print(f"{'state':>6} | {'time, ns/tick':>13} | {'allocated, B/tick':>17}")
+    for name, (state, clock) in make_states().items():
+        ns_per_tick = bench_time(state, clock, ticks_count)
+        allocated_b_per_tick = bench_memory(state, clock, ticks_count // 10)
+        print(f"{name:>6} | {ns_per_tick:>13.1f} | {allocated_b_per_tick:>17.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="number of ticks")
+    args = parser.parse_args()
+
+    run(args.ticks)
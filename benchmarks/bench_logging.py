@@ -0,0 +1,113 @@
+"""Benchmark of logging cost per tick in model, states and settings modules
+
+"before" - modules log as before the facade: each message is formatted eagerly like f-string
+and passed to loguru logger, which checks the level,
+"after" - modules log through facade from logger.get_logger with disabled levels replaced by stubs
+and arguments of messages are formatted only by enabled levels.
+
+Command to run from the project root:
+    python ./benchmarks/bench_logging.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import time
+
+import loguru
+
+import model as model_module
+import settings as settings_module
+import states as states_module
+from clock import VirtualClock
+from model import Model
+from settings import Settings
+from states import CurrentState, StepType
+from view_protocol import NullView
+
+SETTINGS_FILE = "tests/data/settings_valid_mean_values.json"
+BENCHMARKED_MODULES = (model_module, states_module, settings_module)
+
+
+class EagerFormattingLogger:
+    """loguru logger called as with f-strings: message is formatted before the level check"""
+
+    def __init__(self, loguru_logger):
+        self.__logger = loguru_logger
+
+    def __getattr__(self, method_name: str):
+        log_method = getattr(self.__logger, method_name)
+
+        def log(message, *args, **kwargs):
+            # as loguru does, message without arguments is not formatted
+            log_method(str(message).format(*args, **kwargs) if args or kwargs else message)
+
+        return log
+
+
+def bench_model(ticks_count: int) -> float:
+    clock = VirtualClock()
+    model = Model(settings_file=SETTINGS_FILE, clock=clock)
+    model.set_view(NullView(countdown_visible=True))
+    start_time = time.process_time()
+    while clock.waits_count < ticks_count:
+        model.do_current_step_actions()
+        model.wait_for_current_step_is_ended()
+        model.set_new_step_in_sequence()
+    # the last step is completed, so number of ticks can be a bit bigger than requested
+    return (time.process_time() - start_time) * ticks_count / clock.waits_count
+
+
+def bench_states(ticks_count: int) -> float:
+    current_state = CurrentState()
+    start_time = time.process_time()
+    for _ in range(ticks_count):
+        current_state.update_elapsed_time()
+        current_state.set_current_step_data(StepType.work_mode, current_state.current_step_duration)
+    return time.process_time() - start_time
+
+
+def bench_settings(ticks_count: int) -> float:
+    settings = Settings(SETTINGS_FILE)
+    start_time = time.process_time()
+    for _ in range(ticks_count):
+        settings.apply_settings_from_file()
+    return time.process_time() - start_time
+
+
+def run_all(ticks_count: int) -> dict[str, float]:
+    """Return CPU time per tick in microseconds by module name"""
+    results = {}
+    bench_funcs = {"model": bench_model, "states": bench_states, "settings": bench_settings}
+    for module_name, bench_func in bench_funcs.items():
+        results[module_name] = bench_func(ticks_count) / ticks_count * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--ticks", type=int, default=20000, help="number of ticks for each module")
+    args = parser.parse_args()
+
+    # only the application file sink is left, as in running application without console
+    loguru.logger.remove(0)
+
+    facade_loggers = {module: module.logger for module in BENCHMARKED_MODULES}
+    eager_logger = EagerFormattingLogger(loguru.logger)
+    for module in BENCHMARKED_MODULES:
+        module.logger = eager_logger
+    results_before = run_all(args.ticks)
+
+    for module, facade_logger in facade_loggers.items():
+        module.logger = facade_logger
+    results_after = run_all(args.ticks)
+
+    print(f"{'module':>10} | {'before, us/tick':>15} | {'after, us/tick':>14} | {'speedup':>7}")
+    for module_name in results_before:
+        before_us = results_before[module_name]
+        after_us = results_after[module_name]
+        print(f"{module_name:>10} | {before_us:>15.2f} | {after_us:>14.2f} | {before_us / after_us:>6.1f}x")
@@ -0,0 +1,76 @@
+"""Microbenchmark of settings: load, validate, apply and save
+
+"load" - reading, validation and applying of settings file,
+"validate" - validation of settings file content only,
+"apply" - validation and applying of settings from UI without saving,
+"save" - atomic writing of changed settings to file,
+"save unchanged" - saving of settings, which are equal to the file content, so writing is skipped.
+
+Command to run from the project root:
+    python ./benchmarks/bench_settings.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from settings import Settings, UserSettingsData
+from settings_validator import SettingsDataValidator
+
+SETTINGS_FILE = "tests/data/settings_valid_mean_values.json"
+
+
+def measure_us(func: Callable[[int], None], repeats: int) -> float:
+    """Return time of one call in microseconds, the number of call is passed to function"""
+    start_time_ns = time.perf_counter_ns()
+    for i in range(repeats):
+        func(i)
+    return (time.perf_counter_ns() - start_time_ns) / repeats / 1000
+
+
+def run(repeats: int) -> None:
+    settings = Settings(SETTINGS_FILE)
+    settings_str = Path(SETTINGS_FILE).read_text(encoding="utf-8")
+    user_settings_list = []
+    for work_duration in (30, 40):
+        user_settings = UserSettingsData()
+        user_settings.work_duration = work_duration
+        user_settings_list.append(user_settings)
+
+    results = {
+        "load": measure_us(lambda i: settings.apply_settings_from_file(), repeats),
+        "validate": measure_us(lambda i: SettingsDataValidator.model_validate_json(settings_str), repeats),
+        "apply": measure_us(
+            lambda i: settings.apply_settings_from_ui(user_settings_list[i % 2], save_to_file=False), repeats
+        ),
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = Settings(str(Path(tmp_dir) / "settings.json"))
+
+        def save_changed(i: int) -> None:
+            settings.user_settings.work_duration = 30 + i % 2
+            settings.save_settings_to_file()
+
+        # writing to disk with fsync is much slower, so it is measured with less repeats
+        results["save"] = measure_us(save_changed, max(1, repeats // 100))
+        results["save unchanged"] = measure_us(lambda i: settings.save_settings_to_file(), repeats)
+
+    print(f"{'operation':>15} | {'time, us':>9}")
+    for operation, time_us in results.items():
+        print(f"{operation:>15} | {time_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeats", type=int, default=10_000, help="number of repeats of each operation")
+    args = parser.parse_args()
+
+    run(args.repeats)
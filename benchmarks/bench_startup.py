@@ -0,0 +1,190 @@
+"""Benchmark of application startup: import cost of modules, time to tray icon and RSS
+
+Import of each module of the project is measured in a fresh process with "python -X importtime",
+the table shows cumulative import time and heavy third-party packages loaded by the import.
+Startup with eager and lazy windows creation is measured in separate processes,
+desktop session is needed for windows and tray icon, "--imports-only" skips it.
+RSS is measured with psutil if it is installed, otherwise with resource module (peak RSS, not on Windows).
+
+Results can be saved with "--save-baseline" and compared with "--baseline",
+the exit code is 1 if some measurement is slower than baseline more than allowed.
+
+Command to run from the project root:
+    python ./benchmarks/bench_startup.py
+"""
+
+import time
+
+START_TIME_S = time.perf_counter()
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import json
+import subprocess
+from pathlib import Path
+
+MODES = ("eager", "lazy")
+PROJECT_MODULES = (
+    "logger",
+    "clock",
+    "states",
+    "settings",
+    "settings_validator",
+    "model",
+    "runtime",
+    "controller",
+    "windows.wnd_status",
+    "windows.wnd_settings",
+    "windows.wnd_break",
+    "view",
+    "main",
+)
+HEAVY_PACKAGES = ("loguru", "pydantic", "PIL", "customtkinter", "pystray")
+
+# measurement is a regression if it is slower than baseline by both relative and absolute values
+MAX_SLOWDOWN_RATIO = 1.2
+MAX_SLOWDOWN_MS = 5.0
+
+
+def get_rss_mb() -> float | None:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        import resource
+
+        # peak RSS in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+    except ImportError:
+        return None
+
+
+def measure_startup(mode: str) -> None:
+    """Creating view in current process and printing measurements as json"""
+    from view import View
+
+    imported_time_s = time.perf_counter()
+    view = View(lazy_windows=mode == "lazy")
+    # tray icon is shown at the end of view creation
+    tray_icon_time_s = time.perf_counter()
+    view.update()
+
+    print(
+        json.dumps(
+            {
+                "mode": mode,
+                "import_s": imported_time_s - START_TIME_S,
+                "time_to_tray_icon_s": tray_icon_time_s - START_TIME_S,
+                "rss_mb": get_rss_mb(),
+            }
+        ),
+        flush=True,
+    )
+    view.exit_app()
+
+
+def measure_import(module: str) -> tuple[float, list[str]] | None:
+    """Return cumulative import time of module in ms and heavy packages loaded by it, None if import fails"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, './src'); import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return None
+    import_time_ms = 0.0
+    loaded_packages = set()
+    # line format: "import time: self [us] | cumulative | imported package"
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        loaded_packages.add(name.partition(".")[0])
+        if name == module:
+            import_time_ms = int(cumulative_us) / 1000
+    return import_time_ms, [package for package in HEAVY_PACKAGES if package in loaded_packages]
+
+
+def check_regression(name: str, value_ms: float, baseline: dict[str, float]) -> str:
+    """Return mark of comparison with baseline"""
+    if name not in baseline:
+        return ""
+    baseline_ms = baseline[name]
+    if value_ms > baseline_ms * MAX_SLOWDOWN_RATIO and value_ms - baseline_ms > MAX_SLOWDOWN_MS:
+        return f"REGRESSION (baseline {baseline_ms:.1f})"
+    return f"ok (baseline {baseline_ms:.1f})"
+
+
+def run(repeats: int, imports_only: bool, baseline_file: str | None, save_baseline_file: str | None) -> bool:
+    """Printing results, return False if some measurement is regression"""
+    baseline = json.loads(Path(baseline_file).read_text(encoding="utf-8")) if baseline_file else {}
+    results_ms: dict[str, float] = {}
+    marks = []
+
+    print(f"{'module':>20} | {'import, ms':>10} | {'heavy packages':<40} | baseline")
+    for module in PROJECT_MODULES:
+        measurements = [measure_import(module) for _ in range(repeats)]
+        if None in measurements:
+            print(f"{module:>20} | {'n/a':>10} | import failed")
+            continue
+        import_ms = min(import_time_ms for import_time_ms, _ in measurements)
+        heavy_packages = ", ".join(measurements[0][1])
+        name = f"import {module}"
+        results_ms[name] = import_ms
+        marks.append(check_regression(name, import_ms, baseline))
+        print(f"{module:>20} | {import_ms:>10.1f} | {heavy_packages:<40} | {marks[-1]}")
+
+    if not imports_only:
+        results = {mode: [] for mode in MODES}
+        for _ in range(repeats):
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", mode], capture_output=True, text=True, check=True
+                ).stdout
+                results[mode].append(json.loads(output.strip().splitlines()[-1]))
+
+        print()
+        print(f"{'mode':>6} | {'import, s':>9} | {'time to tray icon, s':>20} | {'RSS, MB':>8} | baseline")
+        for mode, measurements in results.items():
+            import_s = min(measurement["import_s"] for measurement in measurements)
+            tray_icon_s = min(measurement["time_to_tray_icon_s"] for measurement in measurements)
+            rss_values = [
+                measurement["rss_mb"] for measurement in measurements if measurement["rss_mb"] is not None
+            ]
+            rss_str = f"{min(rss_values):>8.1f}" if rss_values else f"{'n/a':>8}"
+            name = f"time to tray icon {mode}"
+            results_ms[name] = tray_icon_s * 1000
+            marks.append(check_regression(name, results_ms[name], baseline))
+            print(f"{mode:>6} | {import_s:>9.3f} | {tray_icon_s:>20.3f} | {rss_str} | {marks[-1]}")
+
+    if save_baseline_file:
+        Path(save_baseline_file).write_text(json.dumps(results_ms, indent=4), encoding="utf-8")
+        print(f"baseline is saved to {save_baseline_file}")
+    is_ok = not any(mark.startswith("REGRESSION") for mark in marks)
+    if not is_ok:
+        print("startup is slower than baseline")
+    return is_ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="number of startups in each mode")
+    parser.add_argument("--child", choices=MODES, help="measure startup in current process")
+    parser.add_argument("--imports-only", action="store_true", help="measure imports without startup of view")
+    parser.add_argument("--baseline", help="json file with previous results for comparison")
+    parser.add_argument("--save-baseline", help="json file for saving of results")
+    args = parser.parse_args()
+
+    if args.child is not None:
+        measure_startup(args.child)
+    elif not run(args.repeats, args.imports_only, args.baseline, args.save_baseline):
+        sys.exit(1)
@@ -0,0 +1,72 @@
+"""Regression benchmark for steps table: memory and time of applying user settings
+
+Command to run from the project root:
+    python ./benchmarks/bench_steps_table.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from model import Model
+from settings import UserSettingsData
+from view_protocol import NullView
+
+# allowed growth of memory and time between the first and the last batch of applies
+MAX_MEMORY_GROWTH_B = 16 * 1024
+MAX_TIME_GROWTH_RATIO = 1.5
+
+
+def run(applies_count: int, batch_size: int) -> bool:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model = Model(settings_file=str(Path(tmp_dir) / "settings.json"))
+        model.set_view(NullView())
+        steps_table_len = len(model.steps_table)
+
+        tracemalloc.start()
+        batches = []
+        for batch_start in range(0, applies_count, batch_size):
+            start_time = time.perf_counter()
+            for i in range(batch_start, batch_start + batch_size):
+                user_settings = UserSettingsData()
+                user_settings.work_duration = 1 + i % 100
+                user_settings.break_duration = 1 + (i * 7) % 100
+                model.apply_new_user_settings(user_settings)
+            apply_time_us = (time.perf_counter() - start_time) / batch_size * 1e6
+            memory_b, _ = tracemalloc.get_traced_memory()
+            batches.append((batch_start + batch_size, apply_time_us, memory_b))
+        tracemalloc.stop()
+
+    print(f"{'applies':>8} | {'us per apply':>12} | {'traced memory, B':>16}")
+    for applies, apply_time_us, memory_b in batches:
+        print(f"{applies:>8} | {apply_time_us:>12.1f} | {memory_b:>16}")
+
+    memory_growth_b = batches[-1][2] - batches[0][2]
+    time_growth_ratio = batches[-1][1] / batches[0][1]
+    print(f"Steps table length: {steps_table_len} -> {len(model.steps_table)}")
+    print(f"Memory growth: {memory_growth_b} B, time growth ratio: {time_growth_ratio:.2f}")
+
+    return (
+        len(model.steps_table) == steps_table_len
+        and memory_growth_b <= MAX_MEMORY_GROWTH_B
+        and time_growth_ratio <= MAX_TIME_GROWTH_RATIO
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--applies", type=int, default=2000, help="number of settings applies")
+    parser.add_argument("--batch", type=int, default=250, help="number of applies in one measurement")
+    args = parser.parse_args()
+
+    if not run(args.applies, args.batch):
+        print("Regression: steps table memory or update time is growing")
+        sys.exit(1)
@@ -0,0 +1,123 @@
+"""Regression benchmark of model tick loop without windows: time, memory and steps transitions per tick
+
+Model is driven by virtual clock and NullView with visible countdown, so each tick is one simulated second.
+Time is measured in the first run, memory in the second run under tracemalloc:
+"retained blocks" - memory blocks, which are not freed after ticks (leaks),
+"temporary bytes" - peak of memory allocated and freed inside of each tick.
+Exit code is 1 if some measurement exceeds threshold.
+
+Command to run from the project root:
+    python ./benchmarks/bench_tick_loop.py
+"""
+
+import sys
+
+sys.path.insert(0, "./src")
+
+import argparse
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from clock import VirtualClock
+from model import Model
+from view_protocol import NullView
+
+MAX_NS_PER_TICK = 50_000
+MAX_RETAINED_BLOCKS_PER_TICK = 0.01
+MAX_TEMPORARY_B_PER_TICK = 1024
+
+
+class TracingClock(VirtualClock):
+    """Virtual clock, which sums peaks of traced memory between waits"""
+
+    def __init__(self):
+        super().__init__()
+        self.temporary_b = 0
+        self.__last_memory_b = 0
+
+    def wait(self, event: threading.Event, timeout: float | None) -> bool:
+        memory_b, peak_memory_b = tracemalloc.get_traced_memory()
+        self.temporary_b += peak_memory_b - self.__last_memory_b
+        tracemalloc.reset_peak()
+        self.__last_memory_b = memory_b
+        return super().wait(event, timeout)
+
+
+def run_ticks(model: Model, clock: VirtualClock, ticks_count: int) -> int:
+    """Running model steps until given number of ticks, return number of steps transitions"""
+    transitions_count = 0
+    while clock.waits_count < ticks_count:
+        model.do_current_step_actions()
+        model.wait_for_current_step_is_ended()
+        model.set_new_step_in_sequence()
+        transitions_count += 1
+    return transitions_count
+
+
+def bench_time(settings_file: str, ticks_count: int) -> tuple[float, int, int]:
+    """Return ns per tick, number of ticks and number of transitions"""
+    clock = VirtualClock()
+    model = Model(settings_file=settings_file, clock=clock)
+    model.set_view(NullView(countdown_visible=True))
+
+    start_time_ns = time.perf_counter_ns()
+    transitions_count = run_ticks(model, clock, ticks_count)
+    elapsed_time_ns = time.perf_counter_ns() - start_time_ns
+    return elapsed_time_ns / clock.waits_count, clock.waits_count, transitions_count
+
+
+def bench_memory(settings_file: str, ticks_count: int) -> tuple[float, float]:
+    """Return retained blocks per tick and temporary bytes per tick"""
+    clock = TracingClock()
+    model = Model(settings_file=settings_file, clock=clock)
+    model.set_view(NullView(countdown_visible=True))
+    # warming up, so caches and lazy attributes are created before measurement
+    run_ticks(model, clock, 1000)
+    warmup_ticks_count = clock.waits_count
+
+    tracemalloc.start()
+    clock.temporary_b = 0
+    blocks_count = sys.getallocatedblocks()
+    run_ticks(model, clock, warmup_ticks_count + ticks_count)
+    retained_blocks_count = sys.getallocatedblocks() - blocks_count
+    tracemalloc.stop()
+
+    measured_ticks_count = clock.waits_count - warmup_ticks_count
+    return retained_blocks_count / measured_ticks_count, clock.temporary_b / measured_ticks_count
+
+
+def run(ticks_count: int, memory_ticks_count: int, max_ns_per_tick: float) -> bool:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings_file = str(Path(tmp_dir) / "settings.json")
+        ns_per_tick, measured_ticks_count, transitions_count = bench_time(settings_file, ticks_count)
+        retained_blocks_per_tick, temporary_b_per_tick = bench_memory(settings_file, memory_ticks_count)
+
+    checks = (
+        ("time per tick, ns", ns_per_tick, max_ns_per_tick),
+        ("retained blocks per tick", retained_blocks_per_tick, MAX_RETAINED_BLOCKS_PER_TICK),
+        ("temporary bytes per tick", temporary_b_per_tick, MAX_TEMPORARY_B_PER_TICK),
+    )
+    print(f"ticks: {measured_ticks_count}, transitions: {transitions_count}")
+    print(f"{'measurement':>25} | {'value':>10} | {'threshold':>10}")
+    passed = True
+    for name, value, threshold in checks:
+        status = "ok" if value <= threshold else "REGRESSION"
+        passed = passed and value <= threshold
+        print(f"{name:>25} | {value:>10.2f} | {threshold:>10.2f} {status}")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="number of simulated ticks for time")
+    parser.add_argument("--memory-ticks", type=int, default=20_000, help="number of simulated ticks for memory")
+    parser.add_argument("--max-ns-per-tick", type=float, default=MAX_NS_PER_TICK, help="threshold of time")
+    args = parser.parse_args()
+
+    if not run(args.ticks, args.memory_ticks, args.max_ns_per_tick):
+        sys.exit(1)
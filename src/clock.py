@@ -0,0 +1,62 @@
+"""Module with clocks for measuring steps time and waiting for deadlines"""
+
+import threading
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """Source of monotonic time and waiting for deadlines"""
+
+    def now(self) -> float:
+        """Monotonic time in seconds"""
+
+    def now_ns(self) -> int:
+        """Monotonic time in nanoseconds"""
+
+    def wait(self, event: threading.Event, timeout: float | None) -> bool:
+        """Waiting until event is set or timeout in seconds is passed, return True if event is set"""
+
+
+class MonotonicClock:
+    """Real clock based on time.monotonic()"""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def now_ns(self) -> int:
+        return time.monotonic_ns()
+
+    def wait(self, event: threading.Event, timeout: float | None) -> bool:
+        return event.wait(timeout)
+
+
+class VirtualClock:
+    """Clock for simulations, where waiting advances time instantly
+
+    Waiting for set event returns at once without advancing time,
+    waiting without timeout blocks until event is set by another thread.
+    """
+
+    def __init__(self, start_time_s: float = 0):
+        # time is kept in integer nanoseconds, so many small advances do not accumulate rounding errors
+        self.__now_ns = round(start_time_s * 1e9)
+        self.waits_count = 0
+
+    def now(self) -> float:
+        return self.__now_ns / 1e9
+
+    def now_ns(self) -> int:
+        return self.__now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.__now_ns += round(seconds * 1e9)
+
+    def wait(self, event: threading.Event, timeout: float | None) -> bool:
+        self.waits_count += 1
+        if event.is_set():
+            return True
+        if timeout is None:
+            return event.wait()
+        self.__now_ns += round(timeout * 1e9)
+        return False
@@ -1,48 +1,61 @@
-from threading import Thread
-
-from logger import logger
+from clock import Clock, MonotonicClock
+from logger import get_logger
 from model import Model
+from runtime import ControllerRuntime
 from settings import UserSettingsData
 from states import StepType
 
+logger = get_logger(__name__)
+
 
 class Controller:
     """Class for time and break control"""
 
-    def __init__(self):
+    def __init__(self, clock: Clock | None = None):
+        self.clock: Clock = clock if clock is not None else MonotonicClock()
         logger.trace("Controller: object was created")
 
     def set_model(self, model: Model):
         """Assigning model to controller"""
         logger.trace("Controller: set_model")
         self.model = model
-        self.thread_alg = None
+        self.runtime = ControllerRuntime(model)
 
     def start(self):
-        """Start controller in separated thread"""
-        if self.thread_alg is None:
-            self.thread_alg = Thread(target=self.main_loop)
-            self.thread_alg.start()
-
-    def stop(self):
-        pass
-
-    def main_loop(self):
-        """Controller main loop in separated thread"""
+        """Start controller runtime in separated thread"""
+        logger.trace("Controller: start")
+        # model is connected before the first step is executed in runtime thread
+        self.model.set_runtime(self.runtime)
+        self.runtime.start()
+
+    def stop(self, timeout_s: float = 2.0) -> bool:
+        """Stop controller runtime, return False if it is not stopped in time"""
+        logger.trace("Controller: stop")
+        is_stopped = self.runtime.stop(timeout_s)
+        self.model.set_runtime(None)
+        return is_stopped
+
+    def main_loop(self, until_time_s: float | None = None):
+        """Blocking controller loop without runtime, it can be limited by time of clock for simulations"""
 
         logger.trace("Controller: main_loop")
-        while True:
+        while until_time_s is None or self.clock.now() < until_time_s:
             self.model.do_current_step_actions()
             self.model.wait_for_current_step_is_ended()
             self.model.set_new_step_in_sequence()
 
     def apply_view_user_settings(self, user_settings: UserSettingsData) -> None:
         logger.trace("EGModel: apply_view_user_settings")
-        self.model.apply_new_user_settings(user_settings)
+        self.model.post_command(self.model.apply_new_user_settings, user_settings)
 
     def switch_suspended_state(self):
-        self.model.switch_suspended_state()
+        self.model.post_command(self.model.switch_suspended_state)
+
+    def wake_up(self):
+        """Forcing model to refresh values before the next deadline"""
+        logger.trace("Controller: wake_up")
+        self.model.wake_up()
 
     def set_step(self, new_step_type: StepType):
         logger.trace("Controller: set_step")
-        self.model.set_step(new_step_type)
+        self.model.post_command(self.model.set_step, new_step_type)
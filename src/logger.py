@@ -1,4 +1,4 @@
-from pathlib import Path as __Path
+import os as __os
 
 import loguru as __loguru
 
@@ -9,21 +9,55 @@ __LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <
 
 __LOG_FILE = "./logs/log.log"
 
-log_file_path = __Path(__LOG_FILE)
-if log_file_path.exists():
-    log_file_path.unlink(missing_ok=True)
+# default level can be changed while debugging, e.g. EYESGUARD_LOG_LEVEL=DEBUG
+__LOG_LEVEL = __os.environ.get("EYESGUARD_LOG_LEVEL", __LOG_LEVEL_WARNING)
+# levels of separate modules, which differ from default level, e.g. {"model": __LOG_LEVEL_DEBUG}
+__LOG_LEVELS_BY_MODULE: dict[str, str] = {}
 
 logger = __loguru.logger
 
-logger.add(
-    sink=__LOG_FILE,
-    level=__LOG_LEVEL_WARNING,
-    format=__LOG_FORMAT,
-    colorize=False,
-    backtrace=True,
-    diagnose=True,
-    encoding="utf8",
-)
 
+def _log_nothing(*args, **kwargs) -> None:
+    """Stub for disabled logging levels"""
 
-logger.debug("Logging started!")
+
+class ModuleLogger:
+    """Logger facade with methods chosen once for module: loguru ones for enabled levels and stubs for others
+
+    Arguments of messages are passed separately, e.g. logger.debug("Step: {}", step_type),
+    so disabled levels cost neither string formatting nor loguru frame inspection.
+    """
+
+    __slots__ = ("trace", "debug", "info", "success", "warning", "error", "critical", "exception")
+
+    def __init__(self, loguru_logger, min_level_no: int):
+        for method_name in self.__slots__:
+            level_name = "ERROR" if method_name == "exception" else method_name.upper()
+            if loguru_logger.level(level_name).no >= min_level_no:
+                setattr(self, method_name, getattr(loguru_logger, method_name))
+            else:
+                setattr(self, method_name, _log_nothing)
+
+
+def get_logger(module_name: str) -> ModuleLogger:
+    """Creating logger for module with levels enabled by settings of the module"""
+    level = __LOG_LEVELS_BY_MODULE.get(module_name.rpartition(".")[2], __LOG_LEVEL)
+    return ModuleLogger(logger, logger.level(level).no)
+
+
+def setup_log_file() -> None:
+    """Writing of log to file, called once by application at start instead of importing of logger
+
+    The file is truncated on opening, so tests and benchmarks importing modules do not touch it.
+    """
+    logger.add(
+        sink=__LOG_FILE,
+        level=min((__LOG_LEVEL, *__LOG_LEVELS_BY_MODULE.values()), key=lambda level: logger.level(level).no),
+        format=__LOG_FORMAT,
+        colorize=False,
+        backtrace=True,
+        diagnose=True,
+        encoding="utf8",
+        mode="w",
+    )
+    logger.debug("Logging started!")
@@ -1,17 +1,23 @@
+from clock import MonotonicClock
 from controller import Controller
-from logger import logger
+from logger import get_logger, setup_log_file
 from model import Model
 from view import View
 
+logger = get_logger(__name__)
+
 
 def main():
     """Main function"""
 
-    logger.trace(f"Function started")
+    setup_log_file()
+    logger.trace("Function started")
 
-    controller = Controller()
-    model = Model()
+    clock = MonotonicClock()
+    controller = Controller(clock)
+    # tray icon is shown by view before model reads and validates settings file
     view = View()
+    model = Model(clock=clock)
 
     controller.set_model(model=model)
     model.set_view(view=view)
@@ -21,6 +27,8 @@ def main():
     logger.info("Program EyesGuard started!")
 
     view.mainloop()
+    # controller is already stopped by exit from tray menu, stopping is repeated for other ways of exit
+    controller.stop()
 
 
 # application entry point
@@ -1,45 +1,54 @@
-# For preventing circular import
-# https://stackoverflow.com/questions/744373/what-happens-when-using-mutual-or-circular-cyclic-imports/67673741#67673741
 from __future__ import annotations
 
+import datetime
+import math
+import queue
+import threading
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from view import View
+from clock import Clock, MonotonicClock
+from logger import get_logger
+from settings import OnOffValue, Settings, UserSettingsData
+from states import CurrentState, ModelSnapshot, StepData, StepsTimeline, StepType
+from view_protocol import ViewProtocol
 
-import datetime
-import time
+if TYPE_CHECKING:
+    from runtime import ControllerRuntime
 
-from logger import logger
-from settings import OnOffValue, Settings, UserSettingsData
-from states import CurrentState, StepData, StepType
+logger = get_logger(__name__)
 
 SETTINGS_FILE = "./settings/settings.json"
 
 
 class Model:
-    TIME_TICK_S = 1
+    # refresh period when some countdown window is shown
+    UI_REFRESH_PERIOD_S = 1
 
-    def __init__(self, settings_file: str = SETTINGS_FILE):
-        self.__view: View
+    def __init__(self, settings_file: str = SETTINGS_FILE, clock: Clock | None = None):
+        self.__view: ViewProtocol
+        self.__clock: Clock = clock if clock is not None else MonotonicClock()
         self.__settings = Settings(settings_file)
-        self.__current_state = CurrentState()
-
-        logger.info(f"User settings: = {self.__settings.user_settings}")
-
-        self.steps_data_list: list[StepData] = []
+        self.__current_state = CurrentState(self.__clock)
+        self.__wake_event = threading.Event()
+        # actions from UI threads, which are executed by controller thread
+        self.__commands: queue.SimpleQueue[tuple[Callable, tuple]] = queue.SimpleQueue()
+        self.__wakeups_count = 0
+        self.__snapshot: ModelSnapshot | None = None
+        self.__runtime: ControllerRuntime | None = None
+
+        logger.info("User settings: = {}", self.__settings.user_settings)
+
+        # fixed size table of steps data indexed by step type, updated in place
+        self.steps_table: tuple[StepData, ...] = tuple(
+            StepData(step_type=step_type) for step_type in StepType
+        )
+        self.__steps_timeline: StepsTimeline
         logger.info(self.__current_state)
 
-        self.__remaining_time_to_display = datetime.timedelta(seconds=0)
-        self.__time_for_work_full = datetime.timedelta(seconds=0)
-
         logger.trace("Model: object was created")
 
     def __init_steps(self):
-        for step_type in StepType:
-            self.steps_data_list.insert(step_type, StepData())
-            self.steps_data_list[step_type].step_type = step_type
-
         # setting steps durations
         self.step_off_duration_td = self.__settings.system_settings.step_suspended_mode_duration
         self.step_suspended_duration_td = self.__settings.system_settings.step_suspended_mode_duration
@@ -47,34 +56,34 @@ class Model:
         self.step_break_duration_td = datetime.timedelta(minutes=self.__settings.user_settings.break_duration)
         self.step_notification_1_time_td = self.__settings.system_settings.step_notification_1_duration
         self.step_notification_2_time_td = self.__settings.system_settings.step_notification_2_duration
-        logger.info(f"step_work_duration_td {self.step_work_duration_td}")
+        logger.info("step_work_duration_td {}", self.step_work_duration_td)
 
-        self.steps_data_list[StepType.off_mode].step_duration_td = self.step_suspended_duration_td
-        self.steps_data_list[StepType.suspended_mode].step_duration_td = self.step_suspended_duration_td
+        self.steps_table[StepType.off_mode].step_duration_td = self.step_suspended_duration_td
+        self.steps_table[StepType.suspended_mode].step_duration_td = self.step_suspended_duration_td
         if self.step_work_duration_td > self.step_notification_1_time_td + self.step_notification_2_time_td:
             logger.info(
-                f"cond 1 {self.step_work_duration_td}  {self.step_notification_1_time_td + self.step_notification_2_time_td}"
+                "cond 1 {}  {}",
+                self.step_work_duration_td,
+                self.step_notification_1_time_td + self.step_notification_2_time_td,
             )
-            self.steps_data_list[StepType.work_mode].step_duration_td = (
+            self.steps_table[StepType.work_mode].step_duration_td = (
                 self.step_work_duration_td
                 - self.step_notification_1_time_td
                 - self.step_notification_2_time_td
             )
         else:
-            self.steps_data_list[StepType.work_mode].step_duration_td = datetime.timedelta(seconds=0)
+            self.steps_table[StepType.work_mode].step_duration_td = datetime.timedelta(seconds=0)
 
-        self.steps_data_list[StepType.work_notified_1].step_duration_td = self.step_notification_1_time_td
-        self.steps_data_list[StepType.work_notified_2].step_duration_td = self.step_notification_2_time_td
-        self.steps_data_list[StepType.break_mode].step_duration_td = self.step_break_duration_td
+        self.steps_table[StepType.work_notified_1].step_duration_td = self.step_notification_1_time_td
+        self.steps_table[StepType.work_notified_2].step_duration_td = self.step_notification_2_time_td
+        self.steps_table[StepType.break_mode].step_duration_td = self.step_break_duration_td
 
-        logger.info(self.steps_data_list)
-        for step in self.steps_data_list:
-            logger.info(f"{step.step_type=}")
-            logger.info(step.step_duration_td)
+        # timeline is rebuilt only when steps durations are changed
+        self.__steps_timeline = StepsTimeline.from_steps_data(self.steps_table)
 
         # set initial step
-        logger.debug(f"Off mode: {self.__settings.user_settings.protection_status}")
-        logger.debug(f"Off value: {OnOffValue.off}")
+        logger.debug("Off mode: {}", self.__settings.user_settings.protection_status)
+        logger.debug("Off value: {}", OnOffValue.off)
         if self.__settings.user_settings.protection_status == OnOffValue.off.value:
             logger.debug("Model: init with off_mode")
             self.set_step(new_step_type=StepType.off_mode)
@@ -82,7 +91,7 @@ class Model:
             logger.debug("Model: init with work_mode")
             self.set_step(new_step_type=StepType.work_mode)
 
-        self.__view.update_all_wnd_values(self.model)
+        self.__view.update_all_wnd_values(self.__snapshot)
 
     def __update_view(self):
         """View initialization with model data"""
@@ -90,79 +99,68 @@ class Model:
         self.__init_steps()
 
         if self.__view is not None:
-            self.__view.update_all_wnd_values(self.model)
+            self.__view.update_all_wnd_values(self.__snapshot)
 
     def __update_tray_icon_values(self):
         """Updating tray icon values"""
         logger.trace("Controller: __update_tray_icon_values")
-
-        self.__calculate_remaining_time_for_work()
-        self.__view.update_tray_icon_values(self.model)
+        self.__view.update_tray_icon_values(self.__snapshot)
 
     def __update_wnd_status(self):
         """Updating status window values"""
         logger.trace("Controller: __update_wnd_status_values")
-
-        self.__remaining_time_to_display = self.__calculate_remaining_time_for_work()
-        self.__time_for_work_full = self.__calculate_time_for_work()
-        self.__view.update_wnd_status(self.model)
+        self.__view.update_wnd_status(self.__snapshot)
 
     def __update_wnd_settings(self):
-        self.__view.update_wnd_settings(self.model)
+        self.__view.update_wnd_settings(self.__snapshot)
 
     def __update_wnd_break(self):
         """Updating break window values"""
         logger.trace("Controller: __update_wnd_break_values")
-        self.__view.update_wnd_break(self.model)
-
-    def __calculate_remaining_time_for_work(self) -> datetime.timedelta:
-        remaining_time_actual: datetime.timedelta = self.model.__current_state.current_step_remaining_time
-        logger.debug(remaining_time_actual)
-        match self.model.__current_state.current_step_type:
-            case StepType.off_mode:
-                remaining_time_actual += (
-                    self.model.steps_data_list[StepType.work_mode].step_duration_td
-                    + self.model.steps_data_list[StepType.work_notified_1].step_duration_td
-                    + self.model.steps_data_list[StepType.work_notified_2].step_duration_td
-                )
-
-            case StepType.work_mode:
-                remaining_time_actual += (
-                    self.model.steps_data_list[StepType.work_notified_1].step_duration_td
-                    + self.model.steps_data_list[StepType.work_notified_2].step_duration_td
-                )
-            case StepType.work_notified_1:
-                remaining_time_actual += self.model.steps_data_list[StepType.work_notified_2].step_duration_td
-        return remaining_time_actual
-
-    def __calculate_time_for_work(self) -> datetime.timedelta:
-        time_for_work = (
-            self.model.steps_data_list[StepType.work_mode].step_duration_td
-            + self.model.steps_data_list[StepType.work_notified_1].step_duration_td
-            + self.model.steps_data_list[StepType.work_notified_2].step_duration_td
-        )
-        match self.model.__current_state.current_step_type:
-            case StepType.off_mode:
-                time_for_work = (
-                    self.model.steps_data_list[StepType.off_mode].step_duration_td
-                    + self.model.steps_data_list[StepType.work_mode].step_duration_td
-                    + self.model.steps_data_list[StepType.work_notified_1].step_duration_td
-                    + self.model.steps_data_list[StepType.work_notified_2].step_duration_td
-                )
-        return time_for_work
+        self.__view.update_wnd_break(self.__snapshot)
 
     def __set_current_step(self, step_type: StepType) -> None:
         """settind step data in current state by step type"""
         logger.trace("Model: __set_current_step")
-        logger.debug(f"Model: new step {step_type}")
+        logger.debug("Model: new step {}", step_type)
 
         self.model.__current_state.reset_elapsed_time()
         self.model.__current_state.set_current_step_data(
-            step_type=step_type, step_duration=self.model.steps_data_list[step_type].step_duration_td
+            step_type=step_type, step_duration=self.model.steps_table[step_type].step_duration_td
+        )
+        logger.debug("Step_type: {}", self.model.__current_state.current_step_type)
+        logger.debug("Step_duration: {}", self.model.__current_state.current_step_duration)
+        logger.debug("Steps data list: {}", self.model.steps_table[step_type])
+        self.__publish_snapshot()
+
+    def __take_snapshot(self) -> ModelSnapshot:
+        """Copying data for views from current state and settings"""
+        current_state = self.__current_state
+        user_settings = self.__settings.user_settings
+        step_type = current_state.current_step_type
+        step_remaining_time = current_state.current_step_remaining_time
+        return ModelSnapshot(
+            step_type=step_type,
+            step_duration=current_state.current_step_duration,
+            step_elapsed_time=current_state.current_step_elapsed_time,
+            step_remaining_time=step_remaining_time,
+            time_until_break=self.__steps_timeline.time_until_break(step_type, step_remaining_time),
+            work_progress=self.__steps_timeline.progress(step_type, step_remaining_time),
+            protection_status=user_settings.protection_status,
+            work_duration=user_settings.work_duration,
+            break_duration=user_settings.break_duration,
+            sounds=user_settings.sounds,
+            notifications=user_settings.notifications,
+            light_break_window=user_settings.light_break_window,
         )
-        logger.debug(f"Step_type: {self.model.__current_state.current_step_type}")
-        logger.debug(f"Step_duration: {self.model.__current_state.current_step_duration}")
-        logger.debug(f"Steps data list: {self.model.steps_data_list[step_type]}")
+
+    def __publish_snapshot(self) -> bool:
+        """Making new snapshot for views, return False if nothing is changed since the last one"""
+        snapshot = self.__take_snapshot()
+        if snapshot == self.__snapshot:
+            return False
+        self.__snapshot = snapshot
+        return True
 
     @property
     def model(self) -> Model:
@@ -172,12 +170,44 @@ class Model:
     @property
     def remaining_working_time_to_display(self) -> datetime.timedelta:
         logger.trace("Model: remaining_working_time_to_display property")
-        return self.__remaining_time_to_display
+        return self.__steps_timeline.time_until_break(
+            self.__current_state.current_step_type, self.__current_state.current_step_remaining_time
+        )
 
     @property
     def time_for_work_full(self) -> datetime.timedelta:
         logger.trace("Model: time_for_work_full property")
-        return self.__time_for_work_full
+        return self.__steps_timeline.cycle_length(self.__current_state.current_step_type)
+
+    @property
+    def work_progress(self) -> float:
+        logger.trace("Model: work_progress property")
+        return self.__steps_timeline.progress(
+            self.__current_state.current_step_type, self.__current_state.current_step_remaining_time
+        )
+
+    @property
+    def snapshot(self) -> ModelSnapshot | None:
+        """The latest data published for views"""
+        return self.__snapshot
+
+    @property
+    def wakeups_count(self) -> int:
+        """Number of wakeups of the step waiting loop"""
+        return self.__wakeups_count
+
+    @property
+    def tray_refresh_period_s(self) -> int:
+        """Refresh period when only tray icon shows remaining time, title changes once per this period"""
+        return self.__settings.system_settings.tray_title_granularity_s
+
+    @property
+    def clock(self) -> Clock:
+        return self.__clock
+
+    @property
+    def view(self) -> ViewProtocol:
+        return self.__view
 
     @property
     def current_state(self) -> CurrentState:
@@ -203,27 +233,40 @@ class Model:
         logger.trace("Model: model_user_settings setter")
         self.__settings.apply_settings_from_ui(user_settings)
 
-    def set_view(self, view: View) -> None:
-        """Assigning controller to view"""
+    def set_view(self, view: ViewProtocol) -> None:
+        """Assigning view to model, it can be any object with view methods, e.g. NullView"""
         logger.trace("Model: set_view started")
         self.__view = view
         self.__update_view()
 
+    def set_runtime(self, runtime: ControllerRuntime | None) -> None:
+        """Assigning asyncio runtime, which waits for deadlines, shows notifications and saves settings"""
+        logger.trace("Model: set_runtime")
+        self.__runtime = runtime
+
+    def __show_notification(self, title: str, text: str) -> None:
+        """Showing notification by runtime task or at once if runtime is not used"""
+        if self.__runtime is not None:
+            # notification is bound to current step, so it is not shown after the step is ended
+            self.__runtime.dispatch_notification(title, text, self.__current_state.current_step_type)
+        else:
+            self.__view.show_notification(title, text)
+
     def do_current_step_actions(self):
         logger.trace("Model: __do_current_step_actions")
-        logger.debug(f"Model: New current step {(self.__current_state.current_step_type)}")
-        logger.debug(f"Model: New step type {type(self.__current_state.current_step_type)}")
-        logger.debug(f"Model: New step duration {self.__current_state.current_step_duration}")
-        logger.debug(f"Model: New step remaining_time {self.__current_state.current_step_remaining_time}")
+        logger.debug("Model: New current step {}", self.__current_state.current_step_type)
+        logger.debug("Model: New step type {}", type(self.__current_state.current_step_type))
+        logger.debug("Model: New step duration {}", self.__current_state.current_step_duration)
+        logger.debug("Model: New step remaining_time {}", self.__current_state.current_step_remaining_time)
 
         match self.model.__current_state.current_step_type:
             case StepType.off_mode:
                 logger.trace("Model: off_mode actions")
-                self.__view.show_notification("Eyes Guard protection is off!", "Attention!")
+                self.__show_notification("Eyes Guard protection is off!", "Attention!")
 
             case StepType.suspended_mode:
                 logger.trace("Model: off_mode actions")
-                self.__view.show_notification("Eyes Guard protection suspended!", "Attention!")
+                self.__show_notification("Eyes Guard protection suspended!", "Attention!")
 
             case StepType.break_mode:
                 logger.trace("Model: break_mode actions")
@@ -231,37 +274,51 @@ class Model:
 
             case StepType.work_notified_1:
                 logger.trace("Model: work_notified_1 actions")
+                self.__view.prepare_wnd_break()
                 if self.__settings.user_settings.notifications == "on":
                     pass
-                    self.__view.show_notification("Break will start in 1 minute!", "Attention!")
+                    self.__show_notification("Break will start in 1 minute!", "Attention!")
 
             case StepType.work_notified_2:
                 logger.trace("Model: work_notified_2 actions")
                 if self.__settings.user_settings.notifications == "on":
-                    self.__view.show_notification("Break will start in 5 seconds!", "Attention!")
+                    self.__show_notification("Break will start in 5 seconds!", "Attention!")
 
             case StepType.work_mode:
                 logger.trace("Model: work_mode actions")
-                self.__view.update_wnd_break(model=self.model)
+                self.__update_wnd_break()
 
     def wait_for_current_step_is_ended(self):
         logger.trace("Model: __wait_for_current_step_is_ended")
-        while True:
-            logger.info(f"Current step type: {self.model.__current_state.current_step_type}")
-            logger.info(f"Step duration: {self.model.__current_state.current_step_duration}")
-            logger.info(f"Step elapsed time: {self.model.__current_state.current_step_elapsed_time}")
-
-            if self.__current_state.current_step_type != StepType.off_mode:
-                if (
-                    self.model.__current_state.current_step_elapsed_time
-                    < self.model.__current_state.current_step_duration
-                ):
-                    self.model.__current_state.increase_elapsed_time()
-                else:
-                    break
-
-            # actions during step is in progress
-            match self.model.__current_state.current_step_type:
+        after_wakeup = False
+        while (timeout_s := self.poll_current_step(after_wakeup)) is not None:
+            self.__clock.wait(self.__wake_event, None if math.isinf(timeout_s) else timeout_s)
+            after_wakeup = True
+
+    def poll_current_step(self, after_wakeup: bool = False) -> float | None:
+        """Checking current step without blocking, return time in seconds until the next deadline
+        or None if step is ended, caller waits for the deadline or wake up before the next poll,
+        the time is math.inf if only wake up can change something"""
+        if after_wakeup:
+            self.__wakeups_count += 1
+        current_state = self.__current_state
+        # event is cleared before checking state, so changes made after it are not lost
+        self.__wake_event.clear()
+        while self.execute_commands():
+            # executed commands wake up model themselves, this wakeup is not needed after executing
+            self.__wake_event.clear()
+        current_state.update_elapsed_time()
+        logger.info("Current step type: {}", current_state.current_step_type)
+        logger.info("Step duration: {}", current_state.current_step_duration)
+        logger.info("Step elapsed time, s: {}", current_state.current_step_elapsed_time_s)
+
+        if current_state.current_step_type != StepType.off_mode:
+            if current_state.current_step_remaining_time_s <= 0:
+                return None
+
+        # actions during step is in progress, views are not updated if shown data is not changed
+        if self.__publish_snapshot():
+            match current_state.current_step_type:
                 case StepType.break_mode:
                     self.__update_wnd_break()
 
@@ -269,7 +326,62 @@ class Model:
                     self.__update_wnd_status()
                     self.__update_tray_icon_values()
 
-            time.sleep(self.TIME_TICK_S)
+        return self.__get_time_until_next_deadline()
+
+    def __get_time_until_next_deadline(self) -> float:
+        """Calculation of time in seconds until current step end or next refresh of displayed time"""
+        step_type = self.__current_state.current_step_type
+        if step_type == StepType.off_mode:
+            # off mode has no deadlines and shows no time, it is changed only by user command or settings
+            return math.inf
+        remaining_time_s = self.__current_state.current_step_remaining_time_s
+        if self.__view.is_countdown_visible():
+            refresh_period_s = self.__get_countdown_refresh_period_s(step_type)
+        elif step_type == StepType.suspended_mode:
+            # tray shows the time of resuming protection, so only the end of suspending is waited
+            return remaining_time_s
+        else:
+            refresh_period_s = self.tray_refresh_period_s
+        elapsed_time_s = self.__current_state.current_step_elapsed_time_s
+        time_until_refresh_s = refresh_period_s - elapsed_time_s % refresh_period_s
+        return min(remaining_time_s, time_until_refresh_s)
+
+    def __get_countdown_refresh_period_s(self, step_type: StepType) -> int:
+        """Refresh period of shown countdown, light break window changes its time once per update interval"""
+        if (
+            step_type == StepType.break_mode
+            and self.__settings.user_settings.light_break_window == OnOffValue.on.value
+        ):
+            return self.__settings.system_settings.light_break_window_update_interval_s
+        return self.UI_REFRESH_PERIOD_S
+
+    def post_command(self, command: Callable, *args) -> None:
+        """Sending action from any thread, it is executed by controller thread at once after waking up"""
+        logger.trace("Model: post_command {}", command)
+        self.__commands.put((command, args))
+        self.wake_up()
+
+    def execute_commands(self) -> int:
+        """Executing posted commands in the thread of controller, return number of executed commands"""
+        executed_count = 0
+        while True:
+            try:
+                command, args = self.__commands.get_nowait()
+            except queue.Empty:
+                return executed_count
+            try:
+                command(*args)
+            except Exception:
+                # failed command must not stop controller thread
+                logger.exception("Error occurred while executing command {}", command)
+            executed_count += 1
+
+    def wake_up(self):
+        """Interrupting waiting for the next deadline, e.g. after step change or showing window"""
+        logger.trace("Model: wake_up")
+        self.__wake_event.set()
+        if self.__runtime is not None:
+            self.__runtime.wake_up()
 
     def set_new_step_in_sequence(self):
         logger.trace("Controller: __set_new_step_in_sequence")
@@ -290,20 +402,35 @@ class Model:
             case StepType.break_mode:
                 new_step_type = StepType.work_mode
 
-        logger.debug(f"Model: new step = {new_step_type}")
+        logger.debug("Model: new step = {}", new_step_type)
         self.__set_current_step(new_step_type)
 
     def apply_new_user_settings(self, user_settings: UserSettingsData) -> None:
         logger.trace("Model: apply_new_settings")
-        self.user_settings = user_settings
+        if self.__runtime is not None:
+            # file is written by persistence task of runtime
+            self.__settings.apply_settings_from_ui(user_settings, save_to_file=False)
+            self.__runtime.request_settings_save(self.__settings.save_settings_to_file)
+        else:
+            self.user_settings = user_settings
+        self.__init_steps()
+        self.wake_up()
+
+    def reload_settings_from_file(self) -> bool:
+        """Applying settings file changed by other program, the file is read only if it is changed"""
+        if not self.__settings.reload_settings_from_file():
+            return False
+        logger.info("Model: settings are reloaded from file")
         self.__init_steps()
+        self.wake_up()
+        return True
 
     def switch_suspended_state(self):
         logger.trace("Model: change_suspended_state")
         if self.current_state.current_step_type != StepType.suspended_mode:
             self.set_step(StepType.suspended_mode)
             logger.debug("Model: show notification")
-            self.__view.show_notification("Eyes Guard protection suspended!", "Attention!")
+            self.__show_notification("Eyes Guard protection suspended!", "Attention!")
 
         else:
             self.set_step(StepType.work_mode)
@@ -315,3 +442,4 @@ class Model:
         self.__update_wnd_break()
         self.__update_wnd_status()
         self.__update_wnd_settings()
+        self.wake_up()
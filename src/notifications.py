@@ -0,0 +1,103 @@
+"""Module with asynchronous dispatcher of notifications"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from clock import Clock
+from logger import get_logger
+from states import StepType
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Notification:
+    title: str
+    text: str
+    # notification about step is stale, if the step is ended before showing
+    step_type: StepType | None
+    submit_time_s: float
+
+
+class NotificationDispatcher:
+    """Queue of notifications shown by backend one by one in a worker thread
+
+    Backend like pystray can block for a long time, so it does not delay the event loop of controller.
+    Queue is bounded: the oldest notification is dropped on overflow. The same notification submitted
+    again within dedup window is ignored and notification about ended step is not shown.
+    submit() and run() are called in the thread of event loop.
+    """
+
+    def __init__(
+        self,
+        backend: Callable[[str, str], None],
+        get_current_step_type: Callable[[], StepType],
+        clock: Clock,
+        dedup_window_s: float = 30.0,
+        maxsize: int = 8,
+    ):
+        self.__backend = backend
+        self.__get_current_step_type = get_current_step_type
+        self.__clock = clock
+        self.__dedup_window_s = dedup_window_s
+        self.__maxsize = maxsize
+        self.__queue: asyncio.Queue[Notification] = asyncio.Queue()
+        # time of the latest submit of each notification
+        self.__submit_times_s: dict[tuple[str, str], float] = {}
+
+        self.shown_count = 0
+        self.deduplicated_count = 0
+        self.stale_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        # time from submit to showing by backend
+        self.last_latency_s: float | None = None
+        self.max_latency_s = 0.0
+
+    def __len__(self) -> int:
+        return self.__queue.qsize()
+
+    def submit(self, title: str, text: str, step_type: StepType | None = None) -> bool:
+        """Queueing notification, return False if it is a duplicate of recent one"""
+        key = (title, text)
+        now_s = self.__clock.now()
+        last_submit_time_s = self.__submit_times_s.get(key)
+        if last_submit_time_s is not None and now_s - last_submit_time_s < self.__dedup_window_s:
+            logger.debug("NotificationDispatcher: duplicate {} is ignored", title)
+            self.deduplicated_count += 1
+            return False
+        self.__submit_times_s[key] = now_s
+
+        if self.__queue.qsize() >= self.__maxsize:
+            dropped = self.__queue.get_nowait()
+            logger.warning("NotificationDispatcher: queue is full, {} is dropped", dropped.title)
+            self.dropped_count += 1
+        self.__queue.put_nowait(Notification(title, text, step_type, time.perf_counter()))
+        return True
+
+    async def run(self) -> None:
+        """Showing queued notifications until cancelling"""
+        while True:
+            notification = await self.__queue.get()
+            step_type = notification.step_type
+            if step_type is not None and step_type != self.__get_current_step_type():
+                logger.debug("NotificationDispatcher: stale {} is dropped", notification.title)
+                self.stale_count += 1
+                continue
+            try:
+                # notification taken from queue is shown even if dispatching is cancelled meanwhile
+                await asyncio.shield(asyncio.to_thread(self.__show, notification))
+            except Exception:
+                # failed notification must not stop dispatching of others
+                logger.exception("Error occurred while showing notification {}", notification.title)
+                self.failed_count += 1
+
+    def __show(self, notification: Notification) -> None:
+        latency_s = time.perf_counter() - notification.submit_time_s
+        self.last_latency_s = latency_s
+        self.max_latency_s = max(self.max_latency_s, latency_s)
+        logger.debug("NotificationDispatcher: {} is shown, latency {:.6f} s", notification.title, latency_s)
+        self.__backend(notification.title, notification.text)
+        self.shown_count += 1
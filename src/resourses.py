@@ -1,17 +1,179 @@
 """Dataclasses for resources"""
 
-from PIL import Image
+from collections import OrderedDict
+from pathlib import Path
+
+import customtkinter
+from PIL import Image, ImageDraw
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+IMG_DIR = "res/img"
+IMG_CACHE_MEMORY_LIMIT_B = 64 * 1024 * 1024
+
+
+class ImgFiles:
+    """Names of image files"""
+
+    protection_active = "eyes_with_protection.png"
+    protection_suspended = "eyes_without_protection.png"
+    protection_off = "eyes_protection_off.png"
+
+    check_mark = "check_mark.png"
+
+    break_wnd_bg = "break_wnd_bg1.png"
+
+    clock = "clock.png"
+    gear = "gear.png"
+    info = "info.png"
+
+
+class ImageCache:
+    """Cache of images, which are loaded on first use and evicted by LRU under memory limit
+
+    Decoded images are stored with key (name, None) and CTkImages of given size with key (name, size).
+    Names of images, which can not be loaded, are remembered, so the file is not opened again.
+    Cache is used from the thread of Tk main loop only.
+    """
+
+    def __init__(self, img_dir: str, memory_limit_b: int):
+        self.__img_dir = Path(img_dir)
+        self.__memory_limit_b = memory_limit_b
+        self.__images: OrderedDict[tuple, tuple[Image.Image | customtkinter.CTkImage, int]] = OrderedDict()
+        self.__failed_names: set[str] = set()
+        self.__memory_used_b = 0
+
+        self.hits_count = 0
+        self.misses_count = 0
+
+    @property
+    def memory_used_b(self) -> int:
+        """Estimated memory of decoded images in cache"""
+        return self.__memory_used_b
+
+    def get_image(self, name: str) -> Image.Image | None:
+        """Return decoded image, None if image can not be loaded"""
+        return self.__get_image(name, is_counted=True)
+
+    def get_ctk_image(self, name: str, size: tuple[int, int]) -> customtkinter.CTkImage | None:
+        """Return CTkImage of given size, the same object is returned for repeated requests"""
+        key = (name, size)
+        ctk_image = self.__get_cached(key, is_counted=True)
+        if ctk_image is None:
+            # request is already counted by lookup of CTkImage
+            image = self.__get_image(name, is_counted=False)
+            if image is None:
+                return None
+            ctk_image = customtkinter.CTkImage(light_image=image, size=size)
+            # estimation of bitmap rendered by CTkImage
+            self.__put_cached(key, ctk_image, size[0] * size[1] * 4)
+        return ctk_image
+
+    def clear(self) -> None:
+        self.__images.clear()
+        self.__failed_names.clear()
+        self.__memory_used_b = 0
+
+    def __get_image(self, name: str, is_counted: bool) -> Image.Image | None:
+        if name in self.__failed_names:
+            if is_counted:
+                self.hits_count += 1
+            return None
+        key = (name, None)
+        image = self.__get_cached(key, is_counted)
+        if image is None:
+            try:
+                image = Image.open(self.__img_dir / name)
+                image.load()
+            except OSError as error:
+                logger.error("Image {} can not be loaded: {}", name, error)
+                self.__failed_names.add(name)
+                return None
+            self.__put_cached(key, image, image.width * image.height * len(image.getbands()))
+        return image
+
+    def __get_cached(self, key: tuple, is_counted: bool):
+        cached = self.__images.get(key)
+        if cached is None:
+            if is_counted:
+                self.misses_count += 1
+            return None
+        if is_counted:
+            self.hits_count += 1
+        self.__images.move_to_end(key)
+        return cached[0]
+
+    def __put_cached(self, key: tuple, image, memory_b: int) -> None:
+        self.__images[key] = (image, memory_b)
+        self.__memory_used_b += memory_b
+        # the least recently used images are evicted, the newest one is kept even if it is bigger than limit
+        while self.__memory_used_b > self.__memory_limit_b and len(self.__images) > 1:
+            evicted_key, (_, evicted_memory_b) = self.__images.popitem(last=False)
+            self.__memory_used_b -= evicted_memory_b
+            logger.debug("ImageCache: {} evicted", evicted_key)
+
+
+image_cache = ImageCache(IMG_DIR, IMG_CACHE_MEMORY_LIMIT_B)
+
+
+class ProgressRingIcons:
+    """Tray icons with ring of work progress, all frames are rendered once from base image
+
+    Progress is shown by the nearest frame, so nothing is drawn while protection is running.
+    """
+
+    RING_COLOR = (46, 160, 67, 255)
+    RING_BG_COLOR = (200, 200, 200, 160)
+    # width of ring relatively to icon size
+    RING_WIDTH_RATIO = 0.12
+
+    def __init__(self, base_image: Image.Image, steps: int = 20):
+        self.steps = max(1, steps)
+        self.__frames = tuple(
+            self.__render_frame(base_image, step / self.steps) for step in range(self.steps + 1)
+        )
+        logger.debug("ProgressRingIcons: {} frames rendered", len(self.__frames))
+
+    def frame_index(self, progress: float) -> int:
+        """Index of frame nearest to progress from 0 to 1"""
+        return min(self.steps, max(0, round(progress * self.steps)))
+
+    def get_frame(self, index: int) -> Image.Image:
+        return self.__frames[index]
+
+    def __render_frame(self, base_image: Image.Image, progress: float) -> Image.Image:
+        frame = base_image.convert("RGBA")
+        draw = ImageDraw.Draw(frame)
+        ring_width = max(1, round(min(frame.size) * self.RING_WIDTH_RATIO))
+        box = (0, 0, frame.width - 1, frame.height - 1)
+        draw.ellipse(box, outline=self.RING_BG_COLOR, width=ring_width)
+        if progress > 0:
+            # progress ring starts at the top and goes clockwise
+            draw.arc(box, start=-90, end=-90 + 360 * progress, fill=self.RING_COLOR, width=ring_width)
+        return frame
+
+
+class _LazyImage:
+    """Image attribute, which is loaded from cache on access"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner) -> Image.Image | None:
+        return image_cache.get_image(self.name)
 
 
 class ResImages:
-    img_protection_active = Image.open("res/img/eyes_with_protection.png")
-    img_protection_suspended = Image.open("res/img/eyes_without_protection.png")
-    img_protection_off = Image.open("res/img/eyes_protection_off.png")
+    img_protection_active = _LazyImage(ImgFiles.protection_active)
+    img_protection_suspended = _LazyImage(ImgFiles.protection_suspended)
+    img_protection_off = _LazyImage(ImgFiles.protection_off)
 
-    img_check_mark = Image.open("res/img/check_mark.png")
+    img_check_mark = _LazyImage(ImgFiles.check_mark)
 
-    img_break_wnd_bg = Image.open("res/img/break_wnd_bg1.png")
+    img_break_wnd_bg = _LazyImage(ImgFiles.break_wnd_bg)
 
-    img_clock = Image.open("res/img/clock.png")
-    img_gear = Image.open("res/img/gear.png")
-    img_info = Image.open("res/img/info.png")
+    img_clock = _LazyImage(ImgFiles.clock)
+    img_gear = _LazyImage(ImgFiles.gear)
+    img_info = _LazyImage(ImgFiles.info)
@@ -0,0 +1,210 @@
+"""Module with asyncio runtime of controller"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from clock import MonotonicClock
+from logger import get_logger
+from notifications import NotificationDispatcher
+from settings_watcher import SettingsFileWatcher
+
+if TYPE_CHECKING:
+    from model import Model
+    from states import StepType
+
+logger = get_logger(__name__)
+
+
+class ControllerRuntime:
+    """asyncio event loop in separated thread with tasks of controller: steps loop,
+    notifications dispatch, settings persistence and watching of settings file
+
+    Tk main loop stays in the main thread, methods of runtime can be called from any thread.
+    Stopping cancels the tasks, waits for them not longer than timeout and saves pending settings.
+    Deadlines are awaited by event loop in real time, so only model with MonotonicClock is supported,
+    simulations with VirtualClock use blocking Controller.main_loop().
+    """
+
+    # settings are saved after this time without new requests, so burst of changes is written once
+    SETTINGS_SAVE_DELAY_S = 1.0
+    # step is polled again after failed poll, so repeated errors do not spin the loop
+    STEP_ERROR_RETRY_DELAY_S = 1.0
+
+    def __init__(self, model: Model):
+        self.__model = model
+        self.__thread: threading.Thread | None = None
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__started_event = threading.Event()
+        self.__stop_requested_time_s: float | None = None
+
+        # created in the thread of event loop
+        self.__wake_up_event: asyncio.Event
+        self.__stop_event: asyncio.Event
+        self.__save_requested_event: asyncio.Event
+        self.__pending_save: Callable[[], None] | None = None
+
+        self.notifications = NotificationDispatcher(
+            backend=self.__show_notification_by_view,
+            get_current_step_type=lambda: model.current_state.current_step_type,
+            clock=model.clock,
+            dedup_window_s=model.settings.system_settings.notification_dedup_window_s,
+        )
+        self.shutdown_latency_s: float | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self) -> None:
+        """Starting event loop with tasks in separated thread"""
+        logger.trace("ControllerRuntime: start")
+        if self.__thread is not None:
+            return
+        clock = self.__model.clock
+        if not isinstance(clock, MonotonicClock):
+            raise TypeError(f"Controller runtime supports only MonotonicClock, not {type(clock).__name__}")
+        # daemon thread does not keep process alive if tasks are not stopped in time
+        self.__thread = threading.Thread(
+            target=asyncio.run, args=(self.__run(),), name="controller", daemon=True
+        )
+        self.__thread.start()
+        self.__started_event.wait()
+
+    def stop(self, timeout_s: float = 2.0) -> bool:
+        """Cancelling tasks and waiting for the end of event loop, return True if it is stopped in time"""
+        logger.trace("ControllerRuntime: stop")
+        if self.__thread is None:
+            return True
+        self.__stop_requested_time_s = time.perf_counter()
+        self.__call_in_loop(self.__stop_event.set)
+        self.__thread.join(timeout_s)
+        if self.__thread.is_alive():
+            logger.error("Controller runtime is not stopped in {} s", timeout_s)
+            return False
+        return True
+
+    def wake_up(self) -> None:
+        """Interrupting waiting for the next deadline of step"""
+        self.__call_in_loop(self.__wake_up_event.set)
+
+    def dispatch_notification(self, title: str, text: str, step_type: StepType | None = None) -> None:
+        """Queueing notification, it is shown by dispatch task if it is still actual"""
+        self.__call_in_loop(self.notifications.submit, title, text, step_type)
+
+    def request_settings_save(self, save_settings: Callable[[], None]) -> None:
+        """Requesting writing of settings by persistence task"""
+        self.__call_in_loop(self.__request_settings_save, save_settings)
+
+    def __call_in_loop(self, callback: Callable, *args) -> None:
+        if self.__loop is None or self.__loop.is_closed():
+            logger.debug("ControllerRuntime: {} is called while runtime is not running", callback)
+            return
+        if threading.current_thread() is self.__thread:
+            callback(*args)
+        else:
+            self.__loop.call_soon_threadsafe(callback, *args)
+
+    def __show_notification_by_view(self, title: str, text: str) -> None:
+        self.__model.view.show_notification(title, text)
+
+    def __request_settings_save(self, save_settings: Callable[[], None]) -> None:
+        self.__pending_save = save_settings
+        self.__save_requested_event.set()
+
+    def __save_pending_settings(self) -> None:
+        save_settings = self.__pending_save
+        self.__pending_save = None
+        if save_settings is not None:
+            try:
+                save_settings()
+            except OSError:
+                logger.exception("Error occurred while saving settings")
+
+    async def __run(self) -> None:
+        self.__loop = asyncio.get_running_loop()
+        self.__wake_up_event = asyncio.Event()
+        self.__stop_event = asyncio.Event()
+        self.__save_requested_event = asyncio.Event()
+        self.__started_event.set()
+
+        tasks = (
+            asyncio.create_task(self.__run_steps(), name="steps"),
+            asyncio.create_task(self.notifications.run(), name="notifications"),
+            asyncio.create_task(self.__persist_settings(), name="settings"),
+            asyncio.create_task(self.__watch_settings_file(), name="settings_watcher"),
+        )
+        await self.__stop_event.wait()
+
+        for task in tasks:
+            task.cancel()
+        for task, result in zip(tasks, await asyncio.gather(*tasks, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error("Task {} is ended with {!r}", task.get_name(), result)
+        # settings changed just before stopping are not lost
+        self.__save_pending_settings()
+
+        if self.__stop_requested_time_s is not None:
+            self.shutdown_latency_s = time.perf_counter() - self.__stop_requested_time_s
+            logger.info("Controller runtime is stopped in {:.6f} s", self.shutdown_latency_s)
+
+    async def __run_steps(self) -> None:
+        model = self.__model
+        while True:
+            self.__run_step_action(model.do_current_step_actions)
+            after_wakeup = False
+            while True:
+                try:
+                    timeout_s = model.poll_current_step(after_wakeup)
+                except Exception:
+                    logger.exception("Error occurred while polling current step")
+                    timeout_s = self.STEP_ERROR_RETRY_DELAY_S
+                # wakeups from other threads are executed by loop after polling, so only wakeups
+                # by commands executed while polling are cleared
+                self.__wake_up_event.clear()
+                if timeout_s is None:
+                    break
+                # asyncio.timeout() is used, because wait_for() can swallow cancellation in Python 3.11
+                try:
+                    async with asyncio.timeout(None if math.isinf(timeout_s) else timeout_s):
+                        await self.__wake_up_event.wait()
+                except TimeoutError:
+                    pass
+                after_wakeup = True
+            self.__run_step_action(model.set_new_step_in_sequence)
+
+    @staticmethod
+    def __run_step_action(action: Callable[[], None]) -> None:
+        # failed action of step, e.g. update of view, must not stop the timeline
+        try:
+            action()
+        except Exception:
+            logger.exception("Error occurred in step action {}", action.__name__)
+
+    async def __persist_settings(self) -> None:
+        while True:
+            await self.__save_requested_event.wait()
+            while self.__save_requested_event.is_set():
+                self.__save_requested_event.clear()
+                await asyncio.sleep(self.SETTINGS_SAVE_DELAY_S)
+            self.__save_pending_settings()
+
+    async def __watch_settings_file(self) -> None:
+        settings = self.__model.settings
+        if settings.settings_file is None:
+            return
+        watcher = SettingsFileWatcher(
+            settings.settings_file, settings.system_settings.settings_file_poll_period_s
+        )
+        try:
+            while True:
+                # the first check finds changes made before watching is started
+                self.__model.reload_settings_from_file()
+                await watcher.wait_for_change()
+        finally:
+            watcher.close()
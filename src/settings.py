@@ -1,15 +1,23 @@
 """Module for settings management in application"""
 
-import copy
+from __future__ import annotations
+
+import dataclasses
 import datetime
+import json
+import os
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING
+
+from logger import get_logger
 
-from pydantic import BaseModel, Field, ValidationError
+if TYPE_CHECKING:
+    from settings_validator import SettingsDataValidator
 
-from logger import logger
+logger = get_logger(__name__)
 
 
 class OnOffValue(Enum):
@@ -17,52 +25,77 @@ class OnOffValue(Enum):
     off = "off"
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemSettingsData:
     """class for storing system settings"""
 
-    step_suspended_mode_duration = datetime.timedelta(minutes=60)
-    step_notification_1_duration = datetime.timedelta(seconds=55)
-    step_notification_2_duration = datetime.timedelta(seconds=5)
+    step_suspended_mode_duration: datetime.timedelta = datetime.timedelta(minutes=60)
+    step_notification_1_duration: datetime.timedelta = datetime.timedelta(seconds=55)
+    step_notification_2_duration: datetime.timedelta = datetime.timedelta(seconds=5)
+
+    # fade animations of windows are turned off in remote desktop sessions
+    fade_animation_enabled: bool = not os.environ.get("SESSIONNAME", "").upper().startswith("RDP")
+    fade_animation_duration_ms: int = 600
+    fade_animation_frame_interval_ms: int = 15
+
+    # period of checking settings file changes, if inotify is not available
+    settings_file_poll_period_s: float = 5.0
+
+    # the same notification is not shown again within this time, e.g. on repeated switching of mode
+    notification_dedup_window_s: float = 30.0
+
+    # remaining time in title of tray icon is rounded up to this period, so the title changes rarely
+    tray_title_granularity_s: int = 60
+    # icon of tray shows ring with work progress, frames are rendered once at start
+    tray_progress_ring_enabled: bool = False
+    tray_progress_ring_steps: int = 20
 
+    # countdown of light break window is updated with this period, so remote session sends less frames
+    light_break_window_update_interval_s: int = 10
 
-@dataclass
+
+@dataclass(slots=True)
 class UserSettingsData:
     """class for storing user settings"""
 
     work_duration: int = 45
     break_duration: int = 15
-    sounds = OnOffValue.on.value
-    notifications = OnOffValue.on.value
-    protection_status = OnOffValue.on.value
+    sounds: str = OnOffValue.on.value
+    notifications: str = OnOffValue.on.value
+    protection_status: str = OnOffValue.on.value
+    # break window without background image and fades for remote sessions
+    light_break_window: str = OnOffValue.off.value
 
     def _settings_to_dict(self) -> dict:
-        # convertation object to dict
-        logger.trace("UserSettingsData: __settings_to_dict")
-        settings_dict = {}
-        for attr in dir(self):
-            if not attr.startswith("_"):
-                settings_dict[attr] = getattr(self, attr)
-        logger.debug(f"UserSettingsData: {settings_dict}")
-        return settings_dict
-
-    def __repr__(self) -> dict:
-        # convertation object to string
-        return self._settings_to_dict()
+        # convertation object to dict with fields in alphabetical order
+        return {field_name: getattr(self, field_name) for field_name in USER_SETTINGS_FIELDS_SORTED}
 
     def __str__(self) -> str:
         # convertation object to string
         return str(self._settings_to_dict())
 
 
-class SettingsDataValidator(BaseModel):
-    """Validation model for settings"""
+# fields of user settings in order of settings file and in alphabetical order for displaying
+USER_SETTINGS_FIELDS = tuple(field.name for field in dataclasses.fields(UserSettingsData))
+USER_SETTINGS_FIELDS_SORTED = tuple(sorted(USER_SETTINGS_FIELDS))
+
 
-    work_duration: int = Field(default=45, gt=0, lt=101)
-    break_duration: int = Field(default=15, gt=0, lt=101)
-    sounds: Literal["on", "off"] = "on"
-    notifications: Literal["on", "off"] = "on"
-    protection_status: Literal["on", "off"] = "on"
+def write_file_atomically(file_path: Path, content: str) -> None:
+    """Writing content to temporary file in the same directory and replacing the file by it,
+    so the file is never left truncated by crash in the middle of writing"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, tmp_file_name = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_file_name, file_path)
+    except BaseException:
+        Path(tmp_file_name).unlink(missing_ok=True)
+        raise
 
 
 class Settings:
@@ -71,21 +104,24 @@ class Settings:
     def __init__(self, file_name: str | None = None):
         self.__user_settings = UserSettingsData()
         self.__system_settings = SystemSettingsData()
+        # content and signature of settings file, which was read or written the last time
+        self.__file_content: str | None = None
+        self.__file_signature: tuple[int, int, int] | None = None
+        self.reads_count = 0
+        self.writes_count = 0
+        self.skipped_writes_count = 0
+        self.__settings_file: Path | None = None
         if file_name is not None:
             self.__settings_file = Path(file_name)
             self.apply_settings_from_file()
 
     def _settings_to_dict(self) -> dict:
         """Convertation settings object to dict"""
-        settings_dict = {}
-        for attr in dir(self.__user_settings):
-            if not attr.startswith("_"):
-                settings_dict[attr] = getattr(self.__user_settings, attr)
-        return settings_dict
+        return self.__user_settings._settings_to_dict()
 
-    def __repr__(self) -> dict:
+    def __repr__(self) -> str:
         """Convertation settings object to view in terminal"""
-        return self._settings_to_dict()
+        return f"Settings({self.__user_settings!r})"
 
     def __str__(self) -> str:
         """Convertation object to string"""
@@ -94,8 +130,12 @@ class Settings:
     def __read_settings_from_file(self) -> str | None:
         """Reading settings from file on disk"""
         settings_str = None
+        # signature is taken before reading, so changes made during reading are detected later
+        self.__file_signature = self.get_file_signature()
         try:
             settings_str = self.__settings_file.read_text("utf-8")
+            self.__file_content = settings_str
+            self.reads_count += 1
         except FileNotFoundError as error:
             logger.error(error)
             logger.error(type(error))
@@ -110,6 +150,9 @@ class Settings:
         """Validation settings"""
         logger.debug(settings_str)
         if settings_str is not None:
+            # pydantic is imported on the first validation, it is not needed for starting of app
+            from settings_validator import SettingsDataValidator, ValidationError
+
             try:
                 settings_validated = SettingsDataValidator.model_validate_json(settings_str)
                 logger.debug(settings_validated)
@@ -123,58 +166,99 @@ class Settings:
     def __apply_settings(self, validated_settings: SettingsDataValidator) -> None:
         """Apply given settings to the app"""
         if validated_settings is not None:
-            for attr in dir(self.__user_settings):
-                if not attr.startswith("_"):
-                    logger.debug(f"Settings: get attr: {attr}")
-                    setattr(self.__user_settings, attr, getattr(validated_settings, attr))
-                    logger.debug(getattr(self.__user_settings, attr))
+            for field_name in USER_SETTINGS_FIELDS:
+                setattr(self.__user_settings, field_name, getattr(validated_settings, field_name))
+            logger.debug("Settings: applied {}", self.__user_settings)
 
     def apply_settings_from_file(self):
         """Read, validate and apply settings from file"""
         logger.trace("Settings: apply_settings_from_file")
         settings_from_file_str = self.__read_settings_from_file()
         settings_validated = self.__validate_settings_str(settings_from_file_str)
-        logger.debug(f"Settings from file {settings_validated}")
+        logger.debug("Settings from file {}", settings_validated)
+        self.__apply_settings(settings_validated)
+
+    def get_file_signature(self) -> tuple[int, int, int] | None:
+        """Modification time, size and inode of settings file, None if there is no file"""
+        try:
+            file_stat = os.stat(self.__settings_file)
+        except (OSError, TypeError):
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def is_file_changed(self) -> bool:
+        """Checking if settings file was changed since the last reading or writing without reading it"""
+        return self.get_file_signature() != self.__file_signature
+
+    def reload_settings_from_file(self) -> bool:
+        """Read, validate and apply settings from file if it was changed by other program,
+        return True if new settings are applied"""
+        if not self.is_file_changed():
+            return False
+        logger.trace("Settings: reload_settings_from_file")
+        previous_file_content = self.__file_content
+        settings_from_file_str = self.__read_settings_from_file()
+        if settings_from_file_str is None or settings_from_file_str == previous_file_content:
+            return False
+        settings_validated = self.__validate_settings_str(settings_from_file_str)
+        if settings_validated is None:
+            return False
+        logger.info("Settings: file was changed, new settings {}", settings_validated)
         self.__apply_settings(settings_validated)
+        return True
 
-    def apply_settings_from_ui(self, new_settings_data: UserSettingsData):
-        """Validate settings and write them to file"""
-        logger.debug(f"New settings from ui to apply: {new_settings_data}")
+    def apply_settings_from_ui(self, new_settings_data: UserSettingsData, save_to_file: bool = True):
+        """Validate settings and write them to file if it is needed"""
+        logger.debug("New settings from ui to apply: {}", new_settings_data)
         logger.debug(type(new_settings_data))
+        from settings_validator import SettingsDataValidator, ValidationError
+
         try:
-            settings_validated = SettingsDataValidator.model_validate(new_settings_data.__repr__())
+            settings_validated = SettingsDataValidator.model_validate(
+                {field_name: getattr(new_settings_data, field_name) for field_name in USER_SETTINGS_FIELDS}
+            )
         except ValidationError as error:
             logger.error(error)
             logger.error(type(error))
             return
         self.__apply_settings(settings_validated)
-        self.save_settings_to_file()
+        if save_to_file:
+            self.save_settings_to_file()
 
     def save_settings_to_file(self):
-        """Save settings to file"""
+        """Save settings to file, writing is skipped if content of file is not changed
+
+        Settings are validated once when they are applied, so they are written without validation.
+        """
         logger.trace("Settings: save_settings_to_file")
-        settings_dict = self._settings_to_dict()
-        logger.debug(settings_dict)
-        logger.debug(type(settings_dict))
-        try:
-            settings_validated = SettingsDataValidator.model_validate(settings_dict)
-        except ValidationError as error:
-            logger.error(error)
-            logger.error(type(error))
+        settings_json = json.dumps(
+            {field_name: getattr(self.__user_settings, field_name) for field_name in USER_SETTINGS_FIELDS},
+            indent=4,
+        )
+        logger.debug("Settings to file {}", settings_json)
+        if settings_json == self.__file_content and self.__settings_file.exists():
+            logger.debug("Settings: file content is not changed")
+            self.skipped_writes_count += 1
             return
-        settings_json = settings_validated.model_dump_json(indent=4)
-        logger.debug(f"Settings to file {settings_json}")
-        self.__settings_file.write_text(settings_json, encoding="utf-8")
+        write_file_atomically(self.__settings_file, settings_json)
+        self.__file_content = settings_json
+        self.__file_signature = self.get_file_signature()
+        self.writes_count += 1
 
     def get_settings_copy(self) -> UserSettingsData:
         """Return copy of settings object"""
-        return copy.copy(self.__user_settings)
+        return dataclasses.replace(self.__user_settings)
 
     @property
     def user_settings(self) -> UserSettingsData:
         """Return of user settings object"""
         return self.__user_settings
 
+    @property
+    def settings_file(self) -> Path | None:
+        """Path of settings file"""
+        return self.__settings_file
+
     @property
     def system_settings(self) -> SystemSettingsData:
         """Return of system settings object"""
@@ -0,0 +1,18 @@
+"""Module with validation model of settings, pydantic is imported only when settings are validated"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field, ValidationError
+
+__all__ = ["SettingsDataValidator", "ValidationError"]
+
+
+class SettingsDataValidator(BaseModel):
+    """Validation model for settings"""
+
+    work_duration: int = Field(default=45, gt=0, lt=101)
+    break_duration: int = Field(default=15, gt=0, lt=101)
+    sounds: Literal["on", "off"] = "on"
+    notifications: Literal["on", "off"] = "on"
+    protection_status: Literal["on", "off"] = "on"
+    light_break_window: Literal["on", "off"] = "off"
@@ -0,0 +1,103 @@
+"""Module with watcher of settings file changes made by other programs"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# constants of inotify from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _init_inotify(directory: Path) -> int | None:
+    """Creating non-blocking inotify descriptor watching directory, None if inotify is not available"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        inotify_fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (OSError, AttributeError) as error:
+        logger.warning("inotify is not available: {}", error)
+        return None
+    if inotify_fd < 0:
+        logger.warning("inotify is not available: {}", os.strerror(ctypes.get_errno()))
+        return None
+
+    # directory is watched, because settings file is replaced by renaming of new file
+    mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    if libc.inotify_add_watch(inotify_fd, os.fsencode(directory), mask) < 0:
+        logger.warning("Directory {} can not be watched: {}", directory, os.strerror(ctypes.get_errno()))
+        os.close(inotify_fd)
+        return None
+    return inotify_fd
+
+
+class SettingsFileWatcher:
+    """Waiting for possible changes of settings file by inotify on Linux or by periodic polling
+
+    Watcher does not read the file, the caller checks modification time and size of the file
+    after waking up and reads it only if they are changed.
+    """
+
+    def __init__(self, settings_file: Path, poll_period_s: float, use_inotify: bool = True):
+        self.__file_name = settings_file.name
+        self.__poll_period_s = poll_period_s
+        self.__inotify_fd = _init_inotify(settings_file.parent) if use_inotify else None
+        logger.debug("SettingsFileWatcher: inotify is used: {}", self.uses_inotify)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self.__inotify_fd is not None
+
+    async def wait_for_change(self) -> None:
+        """Waiting for event about settings file or for the next polling period"""
+        if self.__inotify_fd is None:
+            await asyncio.sleep(self.__poll_period_s)
+            return
+        while not self.__read_events_about_file():
+            await self.__wait_for_inotify_events()
+
+    def close(self) -> None:
+        if self.__inotify_fd is not None:
+            os.close(self.__inotify_fd)
+            self.__inotify_fd = None
+
+    async def __wait_for_inotify_events(self) -> None:
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        loop.add_reader(self.__inotify_fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(self.__inotify_fd)
+
+    def __read_events_about_file(self) -> bool:
+        """Reading all pending inotify events, return True if some of them are about settings file"""
+        is_file_event = False
+        while True:
+            try:
+                events_data = os.read(self.__inotify_fd, 4096)
+            except BlockingIOError:
+                return is_file_event
+            offset = 0
+            while offset < len(events_data):
+                _, _, _, name_length = _INOTIFY_EVENT.unpack_from(events_data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = events_data[offset : offset + name_length].rstrip(b"\0")
+                offset += name_length
+                if os.fsdecode(name) == self.__file_name:
+                    is_file_event = True
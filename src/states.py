@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 import datetime
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import IntEnum
 
-from logger import logger
+from clock import Clock, MonotonicClock
+from logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class StepType(IntEnum):
@@ -17,7 +24,7 @@ class StepType(IntEnum):
     # break_notified = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class StepData:
     """Data for step control"""
 
@@ -25,50 +32,126 @@ class StepData:
     step_duration_td: datetime.timedelta = datetime.timedelta(seconds=0)
 
 
-class CurrentState:
-    """Data about current step"""
+# steps, which are passed one by one before break
+WORK_STEPS_SEQUENCE = (StepType.work_mode, StepType.work_notified_1, StepType.work_notified_2)
 
-    def __init__(self):
-        self.__step_type: StepType = StepType.work_mode
 
-        self.__step_duration_dt: datetime.timedelta = datetime.timedelta(seconds=0)
-        self.__elapsed_time_dt: datetime.timedelta = datetime.timedelta(seconds=0)
-        self.__suspended_mode_active: bool = False
+@dataclass(frozen=True)
+class StepsTimeline:
+    """Precompiled work/notify/break cycle for fast time queries by step type"""
+
+    # time from the end of step until break, indexed by step type
+    time_after_step_until_break: tuple[datetime.timedelta, ...]
+    # full working time of cycle, indexed by step type
+    cycle_work_time: tuple[datetime.timedelta, ...]
+
+    @classmethod
+    def from_steps_data(cls, steps_table: Sequence[StepData]) -> StepsTimeline:
+        """Compiling timeline with suffix sums of work steps durations"""
+        zero_td = datetime.timedelta(seconds=0)
+        time_after_step = [zero_td] * len(StepType)
+        time_until_break = zero_td
+        for step_type in reversed(WORK_STEPS_SEQUENCE):
+            time_after_step[step_type] = time_until_break
+            time_until_break += steps_table[step_type].step_duration_td
+        # all work steps are passed after off mode
+        time_after_step[StepType.off_mode] = time_until_break
+
+        cycle_work_time = [time_until_break] * len(StepType)
+        off_mode_duration_td = steps_table[StepType.off_mode].step_duration_td
+        cycle_work_time[StepType.off_mode] = off_mode_duration_td + time_until_break
+        return cls(tuple(time_after_step), tuple(cycle_work_time))
+
+    def time_until_break(
+        self, step_type: StepType, step_remaining_time: datetime.timedelta
+    ) -> datetime.timedelta:
+        """Time until break from the moment with given remaining time of step"""
+        return step_remaining_time + self.time_after_step_until_break[step_type]
+
+    def cycle_length(self, step_type: StepType) -> datetime.timedelta:
+        """Full working time of cycle for given step"""
+        return self.cycle_work_time[step_type]
+
+    def progress(self, step_type: StepType, step_remaining_time: datetime.timedelta) -> float:
+        """Fraction of working time passed in cycle"""
+        cycle_work_time = self.cycle_work_time[step_type]
+        if cycle_work_time <= datetime.timedelta(seconds=0):
+            return 0
+        return 1 - (step_remaining_time + self.time_after_step_until_break[step_type]) / cycle_work_time
+
 
-        logger.debug(f"Init current state: {self}")
+def round_up_time(time: datetime.timedelta, granularity_s: int) -> datetime.timedelta:
+    """Rounding of time up to granularity, so the displayed time does not reach zero before the end"""
+    if granularity_s <= 1:
+        return datetime.timedelta(seconds=math.ceil(time.total_seconds()))
+    return datetime.timedelta(seconds=math.ceil(time.total_seconds() / granularity_s) * granularity_s)
 
-    def __self_to_dict(self) -> dict:
-        # convertation object to dict
-        self_dict = {
-            "__step_type:": self.__step_type,
-            "__step_duration_dt": self.__step_duration_dt,
-            "__elapsed_time_dt": self.__elapsed_time_dt,
-        }
-        return self_dict
 
-    def __repr__(self) -> dict:
-        # convertation object to dict
-        return self.__self_to_dict()
+NS_IN_S = 1_000_000_000
 
-    def __str__(self) -> str:
-        # convertation object to string
-        return str(self.__self_to_dict())
+
+class CurrentState:
+    """Data about current step
+
+    Times are kept in integer nanoseconds of clock, timedelta objects are created only for displaying.
+    """
+
+    __slots__ = (
+        "__clock",
+        "__step_type",
+        "__step_duration_td",
+        "__step_duration_ns",
+        "__step_start_time_ns",
+        "__elapsed_time_ns",
+        "__suspended_mode_active",
+    )
+
+    def __init__(self, clock: Clock | None = None):
+        self.__clock: Clock = clock if clock is not None else MonotonicClock()
+        self.__step_type: StepType = StepType.work_mode
+
+        self.__step_duration_td: datetime.timedelta = datetime.timedelta(seconds=0)
+        self.__step_duration_ns: int = 0
+        self.__step_start_time_ns: int = self.__clock.now_ns()
+        self.__elapsed_time_ns: int = 0
+        self.__suspended_mode_active: bool = False
+
+        logger.debug("Init current state: {}", self)
+
+    def __repr__(self) -> str:
+        return (
+            f"CurrentState(step_type={self.__step_type!r}, step_duration_ns={self.__step_duration_ns}, "
+            f"elapsed_time_ns={self.__elapsed_time_ns})"
+        )
 
     @property
     def current_step_type(self) -> StepType:
         return self.__step_type
 
     @property
-    def current_step_duration(self):
-        return self.__step_duration_dt
+    def current_step_duration(self) -> datetime.timedelta:
+        return self.__step_duration_td
 
     @property
-    def current_step_elapsed_time(self):
-        return self.__elapsed_time_dt
+    def current_step_elapsed_time(self) -> datetime.timedelta:
+        """Elapsed time for displaying, rounded down to whole seconds"""
+        return datetime.timedelta(seconds=self.__elapsed_time_ns // NS_IN_S)
 
     @property
     def current_step_remaining_time(self) -> datetime.timedelta:
-        return self.__step_duration_dt - self.__elapsed_time_dt
+        """Remaining time for displaying, step duration minus elapsed whole seconds"""
+        elapsed_time_ns = self.__elapsed_time_ns - self.__elapsed_time_ns % NS_IN_S
+        return datetime.timedelta(microseconds=(self.__step_duration_ns - elapsed_time_ns) // 1000)
+
+    @property
+    def current_step_elapsed_time_s(self) -> float:
+        """Precise elapsed time of current step in seconds"""
+        return self.__elapsed_time_ns / NS_IN_S
+
+    @property
+    def current_step_remaining_time_s(self) -> float:
+        """Precise remaining time of current step in seconds"""
+        return (self.__step_duration_ns - self.__elapsed_time_ns) / NS_IN_S
 
     @property
     def suspended_mode_active(self) -> bool:
@@ -80,15 +163,37 @@ class CurrentState:
         """Setting current step type and its duration"""
         logger.trace("CurrentState: set_current_step_data")
         self.__step_type = step_type
-        self.__step_duration_dt = step_duration
-        logger.debug(f"__step_type = {self.__step_type}")
-        logger.debug(f"__step_duration_dt = {self.__step_duration_dt}")
-        logger.debug(f"__elapsed_time_dt = {self.__elapsed_time_dt}")
+        self.__step_duration_td = step_duration
+        self.__step_duration_ns = step_duration // datetime.timedelta(microseconds=1) * 1000
+        logger.debug("CurrentState: {}", self)
 
-    def increase_elapsed_time(self, time_delta: datetime.timedelta = datetime.timedelta(seconds=1)):
-        logger.trace("CurrentState: increase_elapsed_time")
-        self.__elapsed_time_dt += time_delta
-        logger.debug(f"__elapsed_time_dt: {self.__elapsed_time_dt}")
+    def update_elapsed_time(self):
+        """Updating elapsed time of current step by clock"""
+        logger.trace("CurrentState: update_elapsed_time")
+        self.__elapsed_time_ns = self.__clock.now_ns() - self.__step_start_time_ns
 
     def reset_elapsed_time(self):
-        self.__elapsed_time_dt = datetime.timedelta(seconds=0)
+        self.__step_start_time_ns = self.__clock.now_ns()
+        self.__elapsed_time_ns = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSnapshot:
+    """Immutable data of model published for rendering in views
+
+    Views render only from snapshots, so they do not read objects changed by controller thread.
+    """
+
+    step_type: StepType
+    step_duration: datetime.timedelta
+    step_elapsed_time: datetime.timedelta
+    step_remaining_time: datetime.timedelta
+    time_until_break: datetime.timedelta
+    work_progress: float
+    # user settings
+    protection_status: str
+    work_duration: int
+    break_duration: int
+    sounds: str
+    notifications: str
+    light_break_window: str
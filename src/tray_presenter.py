@@ -0,0 +1,88 @@
+"""Module with presenting of model snapshots by tray icon"""
+
+import datetime
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from logger import get_logger
+from states import ModelSnapshot, StepType, round_up_time
+
+logger = get_logger(__name__)
+
+
+class ProgressIcons(Protocol):
+    """Pre-rendered icons with progress of work"""
+
+    def frame_index(self, progress: float) -> int: ...
+
+    def get_frame(self, index: int) -> Any: ...
+
+
+class TrayPresenter:
+    """Updater of tray icon, which pushes icon and title to tray only when they are changed
+
+    pystray sends the whole icon to the shell on each assignment, so the shown icon and title are kept
+    and snapshots, which differ only in time less than displayed granularity, do not touch the tray.
+    Presenter is used from the thread of Tk main loop only.
+    """
+
+    def __init__(
+        self,
+        tray_icon,
+        get_icon: Callable[[str], Any],
+        title_granularity_s: int = 60,
+        progress_icons: ProgressIcons | None = None,
+        now: Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        self.__tray_icon = tray_icon
+        self.__get_icon = get_icon
+        self.__title_granularity_s = title_granularity_s
+        self.__progress_icons = progress_icons
+        self.__now = now
+        self.__shown_icon_key: tuple | None = None
+        self.__shown_title: str | None = None
+
+        self.icon_updates_count = 0
+        self.title_updates_count = 0
+        self.skipped_count = 0
+
+    def update(self, snapshot: ModelSnapshot) -> None:
+        """Showing snapshot by tray icon"""
+        icon_key = self.__get_icon_key(snapshot)
+        title = self.__get_title(snapshot)
+        if icon_key == self.__shown_icon_key and title == self.__shown_title:
+            self.skipped_count += 1
+            return
+
+        if icon_key != self.__shown_icon_key:
+            logger.trace("TrayPresenter: icon {}", icon_key)
+            if icon_key[0] == "progress":
+                self.__tray_icon.icon = self.__progress_icons.get_frame(icon_key[1])
+            else:
+                self.__tray_icon.icon = self.__get_icon(icon_key[0])
+            self.__shown_icon_key = icon_key
+            self.icon_updates_count += 1
+        if title != self.__shown_title:
+            logger.trace("TrayPresenter: title {}", title)
+            self.__tray_icon.title = title
+            self.__shown_title = title
+            self.title_updates_count += 1
+
+    def __get_icon_key(self, snapshot: ModelSnapshot) -> tuple:
+        if snapshot.step_type == StepType.off_mode:
+            return ("protection_off",)
+        if snapshot.step_type == StepType.suspended_mode:
+            return ("protection_suspended",)
+        if self.__progress_icons is not None:
+            return ("progress", self.__progress_icons.frame_index(snapshot.work_progress))
+        return ("protection_active",)
+
+    def __get_title(self, snapshot: ModelSnapshot) -> str:
+        if snapshot.step_type == StepType.off_mode:
+            return "Protection off"
+        if snapshot.step_type == StepType.suspended_mode:
+            # absolute time does not change while suspended, so model does not wake up to refresh it,
+            # it is computed from each snapshot, because suspending can be restarted between renders
+            resume_time = self.__now() + round_up_time(snapshot.step_remaining_time, 1)
+            return f"Protection suspended until {resume_time:%H:%M}"
+        return f"Time until break: {round_up_time(snapshot.time_until_break, self.__title_granularity_s)}"
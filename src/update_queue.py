@@ -0,0 +1,68 @@
+"""Module with queue of UI updates between controller thread and Tk main loop"""
+
+import threading
+from collections.abc import Callable, Hashable
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CoalescingUpdateQueue:
+    """Bounded queue of UI updates, where a new update of the same target replaces the pending one
+
+    Updates are put from any thread and are executed by drain() in the thread of UI.
+    Draining is requested by schedule_drain callback once for the batch of updates.
+    """
+
+    def __init__(self, schedule_drain: Callable[[], None], maxsize: int = 16):
+        self.__schedule_drain = schedule_drain
+        self.__maxsize = maxsize
+        self.__lock = threading.Lock()
+        self.__pending_updates: dict[Hashable, tuple[Callable, tuple]] = {}
+        self.__is_drain_scheduled = False
+
+        self.coalesced_count = 0
+        self.dropped_count = 0
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__pending_updates)
+
+    def put(self, target: Hashable, update_func: Callable, *args) -> None:
+        """Adding update of target, the pending update of the same target is replaced"""
+        with self.__lock:
+            if self.__pending_updates.pop(target, None) is not None:
+                self.coalesced_count += 1
+            elif len(self.__pending_updates) >= self.__maxsize:
+                # the oldest update is dropped to keep queue bounded
+                del self.__pending_updates[next(iter(self.__pending_updates))]
+                self.dropped_count += 1
+            self.__pending_updates[target] = (update_func, args)
+
+            is_drain_needed = not self.__is_drain_scheduled
+            self.__is_drain_scheduled = True
+
+        if is_drain_needed:
+            try:
+                self.__schedule_drain()
+            except Exception:
+                # e.g. Tk main loop is not running yet or is destroyed, the next put tries again
+                with self.__lock:
+                    self.__is_drain_scheduled = False
+                logger.exception("Error occurred while scheduling drain of UI updates")
+
+    def drain(self) -> None:
+        """Executing all pending updates, must be called in the thread of UI"""
+        with self.__lock:
+            pending_updates = self.__pending_updates
+            self.__pending_updates = {}
+            self.__is_drain_scheduled = False
+
+        for target, (update_func, args) in pending_updates.items():
+            logger.trace("CoalescingUpdateQueue: update of {}", target)
+            try:
+                update_func(*args)
+            except Exception:
+                # failed update of one target must not break updates of others
+                logger.exception("Error occurred while updating {}", target)
@@ -1,62 +1,133 @@
 """Module with main widnow of application"""
 
-import os
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
 
 import customtkinter
 import pystray
 
 from controller import Controller
-from logger import logger
-from model import Model
-from resourses import ResImages
+from logger import get_logger
+from resourses import ProgressRingIcons, ResImages
 from settings import Settings, UserSettingsData
-from states import CurrentState, StepType
-from windows.wnd_break import WndBreak
-from windows.wnd_settings import WndSettings
-from windows.wnd_status import WndStatus
+from states import ModelSnapshot, StepType
+from tray_presenter import TrayPresenter
+from update_queue import CoalescingUpdateQueue
+from windows.animation import FadeAnimation
+
+# modules of windows are imported when windows are created, so they do not delay the tray icon
+if TYPE_CHECKING:
+    from windows.wnd_break import WndBreak
+    from windows.wnd_settings import WndSettings
+    from windows.wnd_status import WndStatus
+
+logger = get_logger(__name__)
 
 
 class View(customtkinter.CTk):
     """Main window of application"""
 
-    def __init__(self):
+    def __init__(self, lazy_windows: bool = True):
         super().__init__()
         customtkinter.set_appearance_mode("light")
         customtkinter.set_default_color_theme("blue")
 
-        self.image_protection_active = ResImages.img_protection_active
-        self.image_protection_suspended = ResImages.img_protection_suspended
-        self.image_protection_off = ResImages.img_protection_off
-
         self.__settings = Settings()
-        self.__current_state = CurrentState()
-        self.__wnd_settings = WndSettings(self, self.__settings)
-        self.__wnd_break = WndBreak(self, self.__current_state)
-        self.__wnd_status = WndStatus(self)
+        FadeAnimation.configure(
+            enabled=self.__settings.system_settings.fade_animation_enabled,
+            duration_ms=self.__settings.system_settings.fade_animation_duration_ms,
+            frame_interval_ms=self.__settings.system_settings.fade_animation_frame_interval_ms,
+        )
         self.title("EyesGuard v2.0.0")
 
+        # secondary windows are created on first demand, the latest snapshot is rendered after creation
+        self.__wnd_settings: WndSettings | None = None
+        self.__wnd_break: WndBreak | None = None
+        self.__wnd_status: WndStatus | None = None
+        self.__latest_snapshot: ModelSnapshot | None = None
+        if not lazy_windows:
+            self.__get_wnd_settings()
+            self.__get_wnd_break()
+            self.__get_wnd_status()
+
+        # updates from controller thread are executed in Tk main loop, only the newest one for each window
+        self.__ui_updates = CoalescingUpdateQueue(schedule_drain=self.__schedule_ui_updates_drain)
+
         # tray icon
         menu = (
             pystray.MenuItem("Status", self.__show_status_wnd, default=True),
             pystray.MenuItem("Settings", self.__show_settings_wnd),
             pystray.MenuItem("Exit", self.exit_app),
         )
-        self.__tray_icon = pystray.Icon("name", self.image_protection_active, "Eyes Guard", menu)
+        self.__tray_icon = pystray.Icon("name", ResImages.img_protection_active, "Eyes Guard", menu)
         self.__tray_icon.run_detached()
+        progress_icons = None
+        if self.__settings.system_settings.tray_progress_ring_enabled:
+            progress_icons = ProgressRingIcons(
+                ResImages.img_protection_active, self.__settings.system_settings.tray_progress_ring_steps
+            )
+        self.__tray_presenter = TrayPresenter(
+            self.__tray_icon,
+            get_icon=lambda name: getattr(ResImages, f"img_{name}"),
+            title_granularity_s=self.__settings.system_settings.tray_title_granularity_s,
+            progress_icons=progress_icons,
+        )
 
         # hide main app wnd
         self.withdraw()
         logger.trace("View: object was created")
 
     def __show_status_wnd(self):
-        """Show status wnd"""
+        """Show status wnd, called from tray icon thread"""
         logger.trace("View: show status wnd")
-        self.__wnd_status.show()
+        self.__ui_updates.put("wnd_status_show", lambda: self.__get_wnd_status().show())
+        # model refreshes shown time at once instead of waiting for the next tray refresh
+        self.__ui_updates.put("model_wake_up", self.controller.wake_up)
 
     def __show_settings_wnd(self):
-        """Show settings wnd"""
+        """Show settings wnd, called from tray icon thread"""
         logger.trace("View: show settings wnd")
-        self.__wnd_settings.show()
+        self.__ui_updates.put("wnd_settings_show", lambda: self.__get_wnd_settings().show())
+
+    def __get_wnd_status(self) -> WndStatus:
+        """Status window, which is created on first demand"""
+        if self.__wnd_status is None:
+            logger.trace("View: creating status wnd")
+            from windows.wnd_status import WndStatus
+
+            self.__wnd_status = WndStatus(self)
+            if self.__latest_snapshot is not None:
+                self.__wnd_status.update(self.__latest_snapshot)
+        return self.__wnd_status
+
+    def __get_wnd_settings(self) -> WndSettings:
+        """Settings window, which is created on first demand"""
+        if self.__wnd_settings is None:
+            logger.trace("View: creating settings wnd")
+            from windows.wnd_settings import WndSettings
+
+            self.__wnd_settings = WndSettings(self, self.__settings)
+            if self.__latest_snapshot is not None:
+                self.__wnd_settings.update(self.__latest_snapshot)
+        return self.__wnd_settings
+
+    def __get_wnd_break(self) -> WndBreak:
+        """Break window, which is created on first demand or prepared before the first break"""
+        if self.__wnd_break is None:
+            logger.trace("View: creating break wnd")
+            from windows.wnd_break import WndBreak
+
+            self.__wnd_break = WndBreak(
+                self, self.__settings.system_settings.light_break_window_update_interval_s
+            )
+        return self.__wnd_break
+
+    def prepare_wnd_break(self) -> None:
+        """Creating or preparing break window in advance, so the break starts without delay"""
+        snapshot = self.__latest_snapshot
+        self.__ui_updates.put("wnd_break_prepare", lambda: self.__get_wnd_break().prepare(snapshot))
 
     def show_notification(self, title: str, text: str):
         logger.trace("View: show_notification")
@@ -68,17 +139,24 @@ class View(customtkinter.CTk):
         logger.trace("View: controller was set")
 
     def exit_app(self):
-        """Exit from app"""
+        """Exit from app, called from tray icon thread"""
+        # view can be used without controller, e.g. in startup benchmark
+        if getattr(self, "controller", None) is not None:
+            self.controller.stop()
         self.__tray_icon.visible = False
         self.__tray_icon.stop()
-        self.quit()
-        os._exit(0)
+        # Tk main loop is stopped in its own thread
+        self.after(0, self.quit)
+
+    def __schedule_ui_updates_drain(self):
+        """Scheduling execution of queued updates in Tk main loop"""
+        self.after(0, self.__ui_updates.drain)
 
-    def update_all_wnd_values(self, model: Model):
+    def update_all_wnd_values(self, snapshot: ModelSnapshot):
         """Init all data at windows"""
         logger.trace("View: init_all_views function started")
-        self.__wnd_status.update(model)
-        self.__wnd_settings.update(model)
+        self.update_wnd_status(snapshot)
+        self.update_wnd_settings(snapshot)
 
     def apply_view_user_settings(self):
         logger.trace("View: applying new settings")
@@ -93,43 +171,46 @@ class View(customtkinter.CTk):
             ui_settings_data.protection_status = str(self.__wnd_settings.chbox_protection_status_value.get())
             ui_settings_data.sounds = str(self.__wnd_settings.chbox_sounds_value.get())
             ui_settings_data.notifications = str(self.__wnd_settings.chbox_notifications_value.get())
+            ui_settings_data.light_break_window = str(
+                self.__wnd_settings.chbox_light_break_window_value.get()
+            )
             ui_settings_data.protection_status = str(self.__wnd_settings.chbox_protection_status_value.get())
         except TypeError as error:
-            logger.error(f"Error occuired while reading settings from ui: {error}")
+            logger.error("Error occuired while reading settings from ui: {}", error)
 
-        logger.info(f"Settings read from ui: {str(ui_settings_data)}")
+        logger.info("Settings read from ui: {}", ui_settings_data)
 
         return ui_settings_data
 
-    def show_wnd_break(self):
-        self.__wnd_break.show()
-
-    def hide_wnd_break(self):
-        self.__wnd_break.hide()
-
-    def update_wnd_status(self, model: Model) -> None:
-        self.__wnd_status.update(model)
-
-    def update_wnd_settings(self, model: Model) -> None:
-        self.__wnd_settings.update(model)
+    def update_wnd_status(self, snapshot: ModelSnapshot) -> None:
+        self.__latest_snapshot = snapshot
+        if self.__wnd_status is not None:
+            self.__ui_updates.put("wnd_status", self.__wnd_status.update, snapshot)
+
+    def update_wnd_settings(self, snapshot: ModelSnapshot) -> None:
+        self.__latest_snapshot = snapshot
+        if self.__wnd_settings is not None:
+            self.__ui_updates.put("wnd_settings", self.__wnd_settings.update, snapshot)
+
+    def update_wnd_break(self, snapshot: ModelSnapshot) -> None:
+        self.__latest_snapshot = snapshot
+        # break window is needed only for break, before it the window is not created
+        if self.__wnd_break is not None or snapshot.step_type == StepType.break_mode:
+            # time of publishing is passed for measuring of latency from break start to visible window
+            published_time_s = time.perf_counter()
+            self.__ui_updates.put(
+                "wnd_break", lambda: self.__get_wnd_break().update(snapshot, published_time_s)
+            )
 
-    def update_wnd_break(self, model: Model) -> None:
-        self.__wnd_break.update(model)
+    def is_countdown_visible(self) -> bool:
+        """Checking if some window with countdown timer is shown"""
+        return (self.__wnd_status is not None and self.__wnd_status.is_visible) or (
+            self.__wnd_break is not None and self.__wnd_break.is_visible
+        )
 
-    def update_tray_icon_values(self, model: Model) -> None:
-        logger.trace("View: update_tray_icon_values")
-        self.__tray_icon.title = f"Time until break: {model.remaining_working_time_to_display}"
-        if model.current_state.current_step_type == StepType.off_mode:
-            logger.debug("View: off cond")
-            self.__tray_icon.title = "Protection off"
-            self.__tray_icon.icon = self.image_protection_off
-        elif model.current_state.current_step_type == StepType.suspended_mode:
-            self.__tray_icon.icon = self.image_protection_suspended
-            self.__tray_icon.title = (
-                f"Time until normal mode: {model.current_state.current_step_remaining_time}"
-            )
-        else:
-            self.__tray_icon.icon = self.image_protection_active
+    def update_tray_icon_values(self, snapshot: ModelSnapshot) -> None:
+        # icon and title are pushed to tray by presenter only if they are changed
+        self.__ui_updates.put("tray_icon", self.__tray_presenter.update, snapshot)
 
     def switch_suspended_state(self):
         logger.trace("View: switch_suspended_state")
@@ -0,0 +1,95 @@
+"""Interface of view used by model and views without windows for headless runs"""
+
+from collections import Counter
+from typing import Protocol
+
+from states import ModelSnapshot
+
+
+class ViewProtocol(Protocol):
+    """Methods of view called by model"""
+
+    def is_countdown_visible(self) -> bool:
+        """Return True if some window shows countdown with seconds"""
+
+    def update_all_wnd_values(self, snapshot: ModelSnapshot) -> None: ...
+
+    def update_wnd_status(self, snapshot: ModelSnapshot) -> None: ...
+
+    def update_wnd_settings(self, snapshot: ModelSnapshot) -> None: ...
+
+    def update_wnd_break(self, snapshot: ModelSnapshot) -> None: ...
+
+    def update_tray_icon_values(self, snapshot: ModelSnapshot) -> None: ...
+
+    def show_notification(self, title: str, text: str) -> None: ...
+
+    def prepare_wnd_break(self) -> None: ...
+
+
+class NullView:
+    """View without windows, which ignores all updates"""
+
+    def __init__(self, countdown_visible: bool = False):
+        self.countdown_visible = countdown_visible
+
+    def is_countdown_visible(self) -> bool:
+        return self.countdown_visible
+
+    def update_all_wnd_values(self, snapshot: ModelSnapshot) -> None:
+        pass
+
+    def update_wnd_status(self, snapshot: ModelSnapshot) -> None:
+        pass
+
+    def update_wnd_settings(self, snapshot: ModelSnapshot) -> None:
+        pass
+
+    def update_wnd_break(self, snapshot: ModelSnapshot) -> None:
+        pass
+
+    def update_tray_icon_values(self, snapshot: ModelSnapshot) -> None:
+        pass
+
+    def show_notification(self, title: str, text: str) -> None:
+        pass
+
+    def prepare_wnd_break(self) -> None:
+        pass
+
+
+class RecordingView(NullView):
+    """View without windows, which counts calls and keeps the latest snapshot and notifications"""
+
+    def __init__(self, countdown_visible: bool = False):
+        super().__init__(countdown_visible)
+        self.calls_count: Counter[str] = Counter()
+        self.last_snapshot: ModelSnapshot | None = None
+        self.notifications: list[tuple[str, str]] = []
+
+    def update_all_wnd_values(self, snapshot: ModelSnapshot) -> None:
+        self.calls_count["update_all_wnd_values"] += 1
+        self.last_snapshot = snapshot
+
+    def update_wnd_status(self, snapshot: ModelSnapshot) -> None:
+        self.calls_count["update_wnd_status"] += 1
+        self.last_snapshot = snapshot
+
+    def update_wnd_settings(self, snapshot: ModelSnapshot) -> None:
+        self.calls_count["update_wnd_settings"] += 1
+        self.last_snapshot = snapshot
+
+    def update_wnd_break(self, snapshot: ModelSnapshot) -> None:
+        self.calls_count["update_wnd_break"] += 1
+        self.last_snapshot = snapshot
+
+    def update_tray_icon_values(self, snapshot: ModelSnapshot) -> None:
+        self.calls_count["update_tray_icon_values"] += 1
+        self.last_snapshot = snapshot
+
+    def show_notification(self, title: str, text: str) -> None:
+        self.calls_count["show_notification"] += 1
+        self.notifications.append((title, text))
+
+    def prepare_wnd_break(self) -> None:
+        self.calls_count["prepare_wnd_break"] += 1
@@ -0,0 +1,107 @@
+"""Module with non-blocking animations of windows"""
+
+import time
+from collections.abc import Callable
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FadeAnimation:
+    """Fade of window transparency driven by Tk after() callbacks
+
+    Fade can be reversed at any moment: the new fade starts from the current transparency
+    and takes the part of duration proportional to the remaining change of transparency.
+    """
+
+    # common settings of all animations
+    enabled = True
+    duration_ms = 600
+    frame_interval_ms = 15
+
+    @classmethod
+    def configure(cls, enabled: bool, duration_ms: int, frame_interval_ms: int) -> None:
+        """Setting parameters of all fade animations, e.g. turning them off in remote sessions"""
+        cls.enabled = enabled
+        cls.duration_ms = duration_ms
+        cls.frame_interval_ms = frame_interval_ms
+
+    def __init__(self, wnd, alpha: float = 0):
+        self.__wnd = wnd
+        self.__alpha = alpha
+        self.__start_alpha = alpha
+        self.__target_alpha = alpha
+        self.__start_time_s = 0.0
+        self.__fade_duration_s = 0.0
+        self.__after_id: str | None = None
+        self.__on_finished: Callable[[], None] | None = None
+
+    @property
+    def alpha(self) -> float:
+        return self.__alpha
+
+    @property
+    def is_running(self) -> bool:
+        return self.__after_id is not None
+
+    def fade_in(self, on_finished: Callable[[], None] | None = None) -> None:
+        """Starting fade to opaque window"""
+        self.__start(1, on_finished)
+
+    def fade_out(self, on_finished: Callable[[], None] | None = None) -> None:
+        """Starting fade to transparent window"""
+        self.__start(0, on_finished)
+
+    def set_alpha(self, alpha: float) -> None:
+        """Setting transparency at once without animation"""
+        self.cancel()
+        self.__set_alpha(alpha)
+
+    def cancel(self) -> None:
+        """Stopping fade at the current transparency without calling on_finished"""
+        if self.__after_id is not None:
+            self.__wnd.after_cancel(self.__after_id)
+            self.__after_id = None
+        self.__on_finished = None
+
+    def __start(self, target_alpha: float, on_finished: Callable[[], None] | None) -> None:
+        logger.trace("FadeAnimation: fade to {}", target_alpha)
+        if self.is_running and self.__target_alpha == target_alpha:
+            # the same fade is already in progress
+            self.__on_finished = on_finished
+            return
+
+        self.cancel()
+        self.__start_alpha = self.__alpha
+        self.__target_alpha = target_alpha
+        self.__on_finished = on_finished
+        self.__start_time_s = time.monotonic()
+        self.__fade_duration_s = self.duration_ms / 1000 * abs(target_alpha - self.__alpha)
+
+        if not self.enabled or self.__fade_duration_s <= 0:
+            self.__set_alpha(target_alpha)
+            self.__finish()
+        else:
+            self.__after_id = self.__wnd.after(0, self.__draw_frame)
+
+    def __draw_frame(self) -> None:
+        # transparency depends on elapsed time, so slow frames do not make fade longer
+        progress = min(1, (time.monotonic() - self.__start_time_s) / self.__fade_duration_s)
+        self.__set_alpha(self.__start_alpha + (self.__target_alpha - self.__start_alpha) * progress)
+
+        if progress < 1:
+            self.__after_id = self.__wnd.after(self.frame_interval_ms, self.__draw_frame)
+        else:
+            self.__after_id = None
+            self.__finish()
+
+    def __set_alpha(self, alpha: float) -> None:
+        self.__alpha = alpha
+        self.__wnd.attributes("-alpha", alpha)
+
+    def __finish(self) -> None:
+        on_finished = self.__on_finished
+        self.__on_finished = None
+        if on_finished is not None:
+            on_finished()
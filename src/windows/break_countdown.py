@@ -0,0 +1,65 @@
+"""Module with countdown and transparency changes of break window, it does not depend on Tk"""
+
+import datetime
+from collections.abc import Callable
+
+from states import ModelSnapshot, round_up_time
+from windows.animation import FadeAnimation
+from windows.render import WidgetRenderer
+
+
+def get_break_countdown(snapshot: ModelSnapshot, update_interval_s: int = 1) -> tuple[float, str]:
+    """Progress and text of remaining break time, which change only once per update interval"""
+    remaining_time = round_up_time(snapshot.step_remaining_time, update_interval_s)
+    elapsed_time = max(datetime.timedelta(0), snapshot.step_duration - remaining_time)
+    progress = elapsed_time / snapshot.step_duration if snapshot.step_duration else 0
+    return progress, f"Remaining break time: {remaining_time}"
+
+
+class BreakCountdownDisplay:
+    """Redraws of break window in full and light mode, used by WndBreak and by redraws benchmark
+
+    Full mode has background, fades and countdown with seconds. Light mode for remote sessions
+    has solid background, changes transparency at once and changes countdown once per update interval.
+    """
+
+    def __init__(
+        self,
+        wnd,
+        renderer: WidgetRenderer,
+        progress_widget,
+        remaining_time_widget,
+        light_mode_update_interval_s: int = 10,
+    ):
+        self.light_mode = False
+        self.__fade = FadeAnimation(wnd)
+        self.__renderer = renderer
+        self.__progress_widget = progress_widget
+        self.__remaining_time_widget = remaining_time_widget
+        self.__light_mode_update_interval_s = light_mode_update_interval_s
+
+    @property
+    def shows_background(self) -> bool:
+        return not self.light_mode
+
+    def show(self) -> None:
+        """Making window opaque, it is mapped by caller before"""
+        if self.light_mode:
+            self.__fade.set_alpha(1)
+        else:
+            self.__fade.fade_in()
+
+    def hide(self, on_hidden: Callable[[], None]) -> None:
+        """Making window transparent, on_hidden is called when window can be withdrawn"""
+        if self.light_mode:
+            self.__fade.set_alpha(0)
+            on_hidden()
+        else:
+            self.__fade.fade_out(on_finished=on_hidden)
+
+    def render(self, snapshot: ModelSnapshot) -> None:
+        """Rendering remaining break time, only changed values are sent to widgets"""
+        update_interval_s = self.__light_mode_update_interval_s if self.light_mode else 1
+        progress, remaining_time_text = get_break_countdown(snapshot, update_interval_s)
+        self.__renderer.set_value(self.__progress_widget, progress)
+        self.__renderer.set_value(self.__remaining_time_widget, remaining_time_text)
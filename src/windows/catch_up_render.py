@@ -0,0 +1,30 @@
+"""Module with rendering of window snapshots only while window is visible"""
+
+from states import ModelSnapshot
+
+
+class CatchUpRenderMixin:
+    """Window, which is rendered only while it is visible
+
+    Window implements _render(snapshot), calls _update_snapshot() for new snapshots,
+    _show_latest_snapshot() on showing and resets is_visible on hiding.
+    """
+
+    # hidden window is not rendered, the latest snapshot is rendered on showing
+    is_visible: bool = False
+    latest_snapshot: ModelSnapshot | None = None
+
+    def _render(self, snapshot: ModelSnapshot) -> None:
+        raise NotImplementedError
+
+    def _update_snapshot(self, snapshot: ModelSnapshot) -> None:
+        """Keeping the latest snapshot, it is rendered at once only by visible window"""
+        self.latest_snapshot = snapshot
+        if self.is_visible:
+            self._render(snapshot)
+
+    def _show_latest_snapshot(self) -> None:
+        """Marking window as visible with catch-up render of the snapshot kept while it was hidden"""
+        self.is_visible = True
+        if self.latest_snapshot is not None:
+            self._render(self.latest_snapshot)
@@ -0,0 +1,59 @@
+"""Module with diff-based rendering of widgets"""
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_NOT_RENDERED = object()
+
+
+class WidgetRenderer:
+    """Keeper of the last rendered widgets properties, which sends to Tk only really changed ones
+
+    Each window has its own renderer, so counters of applied and skipped redraws are per window.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.__rendered_values: dict[tuple[int, str], object] = {}
+
+        self.applied_count = 0
+        self.skipped_count = 0
+
+    def configure(self, widget, require_redraw: bool = False, **properties) -> bool:
+        """Configuring widget with changed properties only, return True if widget was configured"""
+        widget_id = id(widget)
+        changed_properties = {
+            name: value
+            for name, value in properties.items()
+            if self.__rendered_values.get((widget_id, name), _NOT_RENDERED) != value
+        }
+        if not changed_properties:
+            self.skipped_count += 1
+            return False
+
+        logger.trace("WidgetRenderer {}: configure {}", self.name, changed_properties)
+        if require_redraw:
+            widget.configure(require_redraw=True, **changed_properties)
+        else:
+            widget.configure(**changed_properties)
+        for name, value in changed_properties.items():
+            self.__rendered_values[(widget_id, name)] = value
+        self.applied_count += 1
+        return True
+
+    def set_value(self, widget, value) -> bool:
+        """Setting value of widget or variable with set() method if it was changed"""
+        key = (id(widget), "value")
+        if self.__rendered_values.get(key, _NOT_RENDERED) == value:
+            self.skipped_count += 1
+            return False
+
+        widget.set(value)
+        self.__rendered_values[key] = value
+        self.applied_count += 1
+        return True
+
+    def forget(self) -> None:
+        """Forgetting rendered values, so the next render applies all properties"""
+        self.__rendered_values.clear()
@@ -7,32 +7,39 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from view import View
 
-import datetime
 import time
-from tkinter import StringVar
+from tkinter import Event, StringVar
 
 import customtkinter
-from PIL import Image
 
-from logger import logger
-from model import Model
-from resourses import ResImages
-from states import CurrentState, StepType
+from logger import get_logger
+from resourses import ImgFiles, image_cache
+from states import ModelSnapshot, StepType
+from windows.break_countdown import BreakCountdownDisplay
+from windows.catch_up_render import CatchUpRenderMixin
+from windows.render import WidgetRenderer
 
+logger = get_logger(__name__)
 
-class WndBreak(customtkinter.CTkToplevel):
-    """Break window"""
 
-    def __init__(self, view: View, current_state: CurrentState, *args, **kwargs):
+class WndBreak(CatchUpRenderMixin, customtkinter.CTkToplevel):
+    """Break window
+
+    Window is prepared before the break: background is scaled to the screen and layout is done
+    while it is hidden, so showing costs only mapping of window and change of transparency.
+    Light mode for remote sessions has solid background, no fades and coarse countdown.
+    """
+
+    def __init__(self, view: View, light_mode_update_interval_s: int = 10, *args, **kwargs):
         super().__init__(*args, fg_color="#000000", **kwargs)
-        self.current_state = current_state
         self.view = view
+        self.__light_mode: bool | None = None
 
-        ws = self.winfo_screenwidth()  # width of the screen
-        hs = self.winfo_screenheight()  # height of the screen
         self.attributes("-alpha", 0)
-        print(ws, hs)
-        self.geometry("%dx%d" % (ws, hs))
+        self.__screen_size: tuple[int, int] | None = None
+        # time of publishing of break snapshot, latency is measured when window is mapped
+        self.__show_requested_time_s: float | None = None
+        self.last_show_latency_s: float | None = None
         self.title("EyesGuard v2.0.0")
 
         self.attributes("-topmost", True)
@@ -40,8 +47,10 @@ class WndBreak(customtkinter.CTkToplevel):
         self.resizable(False, False)
 
         self.grid_rowconfigure(0, weight=1)
-        self.bg_image = customtkinter.CTkImage(ResImages.img_break_wnd_bg, size=(ws, hs))
-        self.bg_image_label = customtkinter.CTkLabel(self, image=self.bg_image, text="")
+        self.bg_image = None
+        # screen size, for which background image was requested
+        self.__bg_image_size: tuple[int, int] | None = None
+        self.bg_image_label = customtkinter.CTkLabel(self, text="")
         self.bg_image_label.grid(row=0, column=0, rowspan=2)
 
         self.remaining_break_time = StringVar()
@@ -62,54 +71,97 @@ class WndBreak(customtkinter.CTkToplevel):
         )
         self.pbar_break_progress.grid(row=2, column=0, padx=20, pady=5, sticky="ew")
 
+        # only changed values of widgets are sent to Tk
+        self.renderer = WidgetRenderer("wnd_break")
+        self.__display = BreakCountdownDisplay(
+            self,
+            self.renderer,
+            progress_widget=self.pbar_break_progress,
+            remaining_time_widget=self.remaining_break_time,
+            light_mode_update_interval_s=light_mode_update_interval_s,
+        )
+
         self.protocol("WM_DELETE_WINDOW", self.on_close_action)
+        self.bind("<Map>", self.__on_map, add="+")
         self.withdraw()
 
+    def prepare(self, snapshot: ModelSnapshot | None = None):
+        """Choosing mode by settings of snapshot, scaling background to the current screen
+        and doing layout of hidden window"""
+        logger.trace("Wnd break: prepare")
+        if self.is_visible:
+            return
+        if snapshot is not None:
+            self.latest_snapshot = snapshot
+        light_mode = self.latest_snapshot is not None and self.latest_snapshot.light_break_window == "on"
+        if light_mode != self.__light_mode:
+            logger.debug("Wnd break: light mode {}", light_mode)
+            self.__light_mode = light_mode
+            self.__display.light_mode = light_mode
+            if self.__display.shows_background:
+                self.bg_image_label.grid()
+            else:
+                self.bg_image_label.grid_remove()
+        screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        if screen_size != self.__screen_size:
+            logger.debug("Wnd break: background for screen {}", screen_size)
+            self.__screen_size = screen_size
+            self.geometry("%dx%d" % screen_size)
+        # image is not loaded in light mode, it is scaled when full mode is chosen,
+        # image, which can not be loaded, is not requested again for the same screen
+        if self.__display.shows_background and self.__bg_image_size != screen_size:
+            self.__bg_image_size = screen_size
+            self.bg_image = image_cache.get_ctk_image(ImgFiles.break_wnd_bg, screen_size)
+            if self.bg_image is not None:
+                self.bg_image_label.configure(image=self.bg_image)
+        self.update_idletasks()
+
     def hide(self):
         """Hide window"""
         logger.trace("Wnd break: hide")
 
-        for i in range(100):
-            self.attributes("-alpha", 1 - i / 100)
-            time.sleep(0.006)
-        self.withdraw()
+        self.is_visible = False
+        self.__display.hide(on_hidden=self.withdraw)
 
     def on_close_action(self):
         logger.trace("Wnd break: on_close_action")
 
         self.view.set_step(new_step_type=StepType.work_mode)
 
-    def show(self):
+    def show(self, show_requested_time_s: float | None = None):
         """Show window"""
         logger.trace("Break wnd: show")
 
+        self.__show_requested_time_s = show_requested_time_s
+        self._show_latest_snapshot()
         self.deiconify()
+        self.__display.show()
 
-        for i in range(100):
-            self.attributes("-alpha", i / 100)
-            time.sleep(0.006)
+    def update(self, snapshot: ModelSnapshot, published_time_s: float | None = None):
+        """Showing window for break and hiding it after, only visible window is rendered
 
-    def update(self, model: Model):
+        published_time_s is time.perf_counter() of publishing of snapshot for measuring of showing latency.
+        """
         logger.trace("WndBreak: update")
-
-        if model.current_state.current_step_type == StepType.break_mode:
-            if model.current_state.current_step_elapsed_time > datetime.timedelta(seconds=0):
-                pbar_value = (
-                    model.current_state.current_step_elapsed_time / model.current_state.current_step_duration
-                )
-            else:
-                pbar_value = 0
-            self.pbar_break_progress.set(pbar_value)
-            self.remaining_break_time.set(
-                f"Remaining break time: {model.steps_data_list[StepType.break_mode].step_duration_td - model.current_state.current_step_elapsed_time}"
-            )
-            if self.state() != "normal":
-                self.show()
+        if snapshot.step_type == StepType.break_mode:
+            self._update_snapshot(snapshot)
+            if not self.is_visible:
+                self.prepare()
+                self.show(published_time_s)
         else:
-            if self.state() == "normal":
+            # snapshot after break is not rendered by window, which is hidden
+            self.latest_snapshot = snapshot
+            if self.is_visible:
                 self.hide()
 
-            self.pbar_break_progress.set(0)
-            self.remaining_break_time.set(
-                f"Remaining break time: {model.steps_data_list[StepType.break_mode].step_duration_td}"
-            )
+    def __on_map(self, event: Event):
+        # bindings of toplevel receive events of child widgets too
+        if event.widget is not self or self.__show_requested_time_s is None:
+            return
+        self.last_show_latency_s = time.perf_counter() - self.__show_requested_time_s
+        self.__show_requested_time_s = None
+        logger.info("Wnd break: shown {:.3f} s after break start", self.last_show_latency_s)
+
+    def _render(self, snapshot: ModelSnapshot):
+        """Rendering remaining break time, only changed values are sent to Tk"""
+        self.__display.render(snapshot)
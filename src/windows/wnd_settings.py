@@ -8,20 +8,23 @@ if TYPE_CHECKING:
     from view import View
 
 import re
-import time
 from tkinter import StringVar
 
 import customtkinter
 from PIL import Image, ImageTk
 
-from logger import logger
-from model import Model
-from resourses import ResImages
+from logger import get_logger
+from resourses import ImgFiles, image_cache
 from settings import Settings
-from states import StepType
+from states import ModelSnapshot, StepType
+from windows.animation import FadeAnimation
+from windows.catch_up_render import CatchUpRenderMixin
+from windows.render import WidgetRenderer
 
+logger = get_logger(__name__)
 
-class WndSettings(customtkinter.CTkToplevel):
+
+class WndSettings(CatchUpRenderMixin, customtkinter.CTkToplevel):
     """Settings window"""
 
     def __init__(self, view: View, settings: Settings, *args, **kwargs):
@@ -34,6 +37,7 @@ class WndSettings(customtkinter.CTkToplevel):
         border_x = 50
         border_y = 150
         self.attributes("-alpha", 0)
+        self.__fade = FadeAnimation(self)
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         self.geometry(
@@ -50,16 +54,14 @@ class WndSettings(customtkinter.CTkToplevel):
         self.configure(fg_color="LightSteelBlue")
 
         # images
-        self.img_eyes_with_protection = customtkinter.CTkImage(
-            self.view.image_protection_active, size=(50, 50)
-        )
-        self.img_eyes_protection_suspended = customtkinter.CTkImage(
-            self.view.image_protection_suspended, size=(50, 50)
+        self.img_eyes_with_protection = image_cache.get_ctk_image(ImgFiles.protection_active, (50, 50))
+        self.img_eyes_protection_suspended = image_cache.get_ctk_image(
+            ImgFiles.protection_suspended, (50, 50)
         )
-        self.img_eyes_protection_off = customtkinter.CTkImage(self.view.image_protection_off, size=(50, 50))
-        self.img_clock = customtkinter.CTkImage(ResImages.img_clock, size=(25, 25))
-        self.img_gear = customtkinter.CTkImage(ResImages.img_gear, size=(25, 25))
-        self.img_info = customtkinter.CTkImage(ResImages.img_info, size=(25, 25))
+        self.img_eyes_protection_off = image_cache.get_ctk_image(ImgFiles.protection_off, (50, 50))
+        self.img_clock = image_cache.get_ctk_image(ImgFiles.clock, (25, 25))
+        self.img_gear = image_cache.get_ctk_image(ImgFiles.gear, (25, 25))
+        self.img_info = image_cache.get_ctk_image(ImgFiles.info, (25, 25))
 
         # set grid layout 2x2
         self.grid_rowconfigure(0, weight=1)
@@ -230,6 +232,20 @@ class WndSettings(customtkinter.CTkToplevel):
         # Temporaly not used
         # self.chbox_notifications.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
 
+        # light break window setting
+        self.chbox_light_break_window_value = customtkinter.StringVar(
+            value=self.settings.get_settings_copy().light_break_window
+        )
+        self.chbox_light_break_window = customtkinter.CTkCheckBox(
+            self.frame_general_settings,
+            text="Light break window (remote desktop)",
+            variable=self.chbox_light_break_window_value,
+            onvalue="on",
+            offvalue="off",
+            font=("", 13),
+        )
+        self.chbox_light_break_window.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
+
         # --- create frame about---
         self.frame_about = customtkinter.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.frame_about.grid_columnconfigure(1, weight=1)
@@ -268,6 +284,9 @@ class WndSettings(customtkinter.CTkToplevel):
         )
         self.discrad.grid(row=0, column=1, padx=30, pady=10, sticky="ew")
 
+        # only changed properties of widgets are sent to Tk
+        self.renderer = WidgetRenderer("wnd_settings")
+
         # actions after elements creation
         self.bind("<FocusIn>", self.on_focus_in)
         self.protocol("WM_DELETE_WINDOW", self.hide)
@@ -284,19 +303,15 @@ class WndSettings(customtkinter.CTkToplevel):
 
     def hide(self):
         """Hide window"""
-        for i in range(100):
-            self.attributes("-alpha", 1 - i / 100)
-            time.sleep(0.006)
-        self.withdraw()
+        self.is_visible = False
+        self.__fade.fade_out(on_finished=self.withdraw)
 
     def show(self):
-        """Show window"""
+        """Show window with catch-up render of the latest snapshot"""
         print("showing top level wnd")
+        self._show_latest_snapshot()
         self.deiconify()
-
-        for i in range(100):
-            self.attributes("-alpha", i / 100)
-            time.sleep(0.006)
+        self.__fade.fade_in()
 
     def is_valid_duration_entry(self, value: str):
         print(value)
@@ -304,35 +319,46 @@ class WndSettings(customtkinter.CTkToplevel):
         print(result)
         return result
 
-    def update_protection_status_image(self, model: Model):
+    def update_protection_status_image(self, snapshot: ModelSnapshot):
         """Updating protection status at settings window"""
-        match model.current_state.current_step_type:
+        match snapshot.step_type:
             case StepType.off_mode:
-                self.navigation_frame_lbl_title.configure(image=self.img_eyes_protection_off)
-                self.navigation_frame_lbl_description.configure(text="Protection off!", text_color="Black")
+                self.renderer.configure(self.navigation_frame_lbl_title, image=self.img_eyes_protection_off)
+                self.renderer.configure(
+                    self.navigation_frame_lbl_description, text="Protection off!", text_color="Black"
+                )
             case StepType.suspended_mode:
-                self.navigation_frame_lbl_title.configure(image=self.img_eyes_protection_suspended)
-                self.navigation_frame_lbl_description.configure(
-                    text="Protection suspended!", text_color="Tomato"
+                self.renderer.configure(
+                    self.navigation_frame_lbl_title, image=self.img_eyes_protection_suspended
+                )
+                self.renderer.configure(
+                    self.navigation_frame_lbl_description, text="Protection suspended!", text_color="Tomato"
                 )
             case _:
-                self.navigation_frame_lbl_title.configure(image=self.img_eyes_with_protection)
-                self.navigation_frame_lbl_description.configure(
-                    text="Cares about your vision", text_color="GreenYellow"
+                self.renderer.configure(self.navigation_frame_lbl_title, image=self.img_eyes_with_protection)
+                self.renderer.configure(
+                    self.navigation_frame_lbl_description,
+                    text="Cares about your vision",
+                    text_color="GreenYellow",
                 )
 
-    def update(self, model: Model):
-        """Updating status window elements states"""
+    def update(self, snapshot: ModelSnapshot):
+        """Updating settings window elements states, hidden window only keeps the snapshot for showing"""
         logger.trace("Settings wnd: update function started")
-        logger.debug(f"Model settings: {model}")
+        self._update_snapshot(snapshot)
+
+    def _render(self, snapshot: ModelSnapshot):
+        """Rendering settings of model snapshot"""
+        logger.debug("Model snapshot: {}", snapshot)
 
-        self.work_duration_value.set(str(model.user_settings.work_duration))
-        self.break_duration_value.set(str(model.user_settings.break_duration))
-        self.chbox_sounds_value.set(value=model.user_settings.sounds)
-        self.chbox_notifications_value.set(value=model.user_settings.notifications)
-        self.chbox_protection_status_value.set(value=model.user_settings.protection_status)
+        self.work_duration_value.set(str(snapshot.work_duration))
+        self.break_duration_value.set(str(snapshot.break_duration))
+        self.chbox_sounds_value.set(value=snapshot.sounds)
+        self.chbox_notifications_value.set(value=snapshot.notifications)
+        self.chbox_protection_status_value.set(value=snapshot.protection_status)
+        self.chbox_light_break_window_value.set(value=snapshot.light_break_window)
 
-        self.update_protection_status_image(model)
+        self.update_protection_status_image(snapshot)
 
     def select_frame_by_name(self, name: str) -> None:
         self.btn_time_settings.configure(
@@ -7,19 +7,20 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from view import View
 
-import datetime
-import time
-
 import customtkinter
 from PIL import Image
 
-from logger import logger
-from model import Model
-from resourses import ResImages
-from states import StepType
+from logger import get_logger
+from resourses import ImgFiles, image_cache
+from states import ModelSnapshot, StepType
+from windows.animation import FadeAnimation
+from windows.catch_up_render import CatchUpRenderMixin
+from windows.render import WidgetRenderer
+
+logger = get_logger(__name__)
 
 
-class WndStatus(customtkinter.CTkToplevel):
+class WndStatus(CatchUpRenderMixin, customtkinter.CTkToplevel):
     """Status window"""
 
     def __init__(self, view: View, *args, **kwargs):
@@ -31,6 +32,7 @@ class WndStatus(customtkinter.CTkToplevel):
         border_x = 50
         border_y = 50
         self.attributes("-alpha", 0)
+        self.__fade = FadeAnimation(self)
         screen_width = self.winfo_screenwidth()  # width of the screen
         screen_height = self.winfo_screenheight()  # height of the screen
         self.geometry(
@@ -43,9 +45,6 @@ class WndStatus(customtkinter.CTkToplevel):
         self.attributes("-toolwindow", True)
 
         self.configure(fg_color="LightSteelBlue")
-        self.img_protection_active = ResImages.img_protection_active
-        self.img_protection_suspended = ResImages.img_protection_suspended
-        self.img_check_mark = ResImages.img_check_mark
 
         self.grid_columnconfigure((0), weight=1)
 
@@ -60,7 +59,7 @@ class WndStatus(customtkinter.CTkToplevel):
             self, orientation="horizontal", height=20, fg_color="#3B8ED0", progress_color="GreenYellow"
         )
         self.pbar_time_until_break.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="ew")
-        logger.debug(f'progress_color = {self.pbar_time_until_break.cget("progress_color")}')
+        logger.debug("progress_color = {}", self.pbar_time_until_break.cget("progress_color"))
         # button change protection state
         self.btn_change_suspended_state = customtkinter.CTkButton(
             self,
@@ -70,7 +69,7 @@ class WndStatus(customtkinter.CTkToplevel):
             height=30,
             width=120,
             corner_radius=50,
-            image=customtkinter.CTkImage(light_image=self.img_protection_active, size=(25, 25)),
+            image=image_cache.get_ctk_image(ImgFiles.protection_active, (25, 25)),
             border_spacing=0,
             font=("", 13, "bold"),
         )
@@ -85,12 +84,15 @@ class WndStatus(customtkinter.CTkToplevel):
             height=30,
             width=150,
             corner_radius=50,
-            image=customtkinter.CTkImage(light_image=self.img_check_mark, size=(30, 30)),
+            image=image_cache.get_ctk_image(ImgFiles.check_mark, (30, 30)),
             border_spacing=0,
             font=("", 13, "bold"),
         )
         self.btn_take_break.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
 
+        # only changed properties of widgets are sent to Tk
+        self.renderer = WidgetRenderer("wnd_status")
+
         self.bind("<FocusOut>", self.on_focus_out)
         self.protocol("WM_DELETE_WINDOW", self.hide)
         self.withdraw()
@@ -101,19 +103,15 @@ class WndStatus(customtkinter.CTkToplevel):
 
     def hide(self):
         """Hide window"""
-        for i in range(100):
-            self.attributes("-alpha", 1 - i / 100)
-            time.sleep(0.006)
-        self.withdraw()
+        self.is_visible = False
+        self.__fade.fade_out(on_finished=self.withdraw)
 
     def show(self):
-        """Show window"""
+        """Show window with catch-up render of the latest snapshot"""
         print("Showing status wnd")
+        self._show_latest_snapshot()
         self.deiconify()
-
-        for i in range(100):
-            self.attributes("-alpha", i / 100)
-            time.sleep(0.006)
+        self.__fade.fade_in()
 
     def __btn_change_protection_state_action(self):
         """Action for pressing changeing protection state button"""
@@ -124,59 +122,55 @@ class WndStatus(customtkinter.CTkToplevel):
         logger.trace("Wnd_status: __btn_take_break_action")
         self.view.set_step(StepType.break_mode)
 
-    def update(self, model: Model):
-        """Updating status window elements states"""
+    def update(self, snapshot: ModelSnapshot):
+        """Updating status window elements states, hidden window only keeps the snapshot for showing"""
         logger.trace("Wnd status: update")
-        if model.time_for_work_full > datetime.timedelta(seconds=0):
-            pbar_value = 1 - model.remaining_working_time_to_display / model.time_for_work_full
-        else:
-            pbar_value = 0
-        self.pbar_time_until_break.set(value=pbar_value)
+        self._update_snapshot(snapshot)
+
+    def _render(self, snapshot: ModelSnapshot):
+        """Rendering snapshot of model, only changed properties are sent to Tk"""
+        renderer = self.renderer
 
-        match model.current_state.current_step_type:
+        match snapshot.step_type:
             case StepType.off_mode:
-                if self.btn_change_suspended_state.cget("state") != "disabled":
-                    self.btn_take_break.configure(state="disabled")
-                    self.lbl_time_until_break.configure(text="Time until break: ∞ : ∞ : ∞")
-                    self.btn_change_suspended_state.configure(
-                        text="Protection off",
-                        image=customtkinter.CTkImage(
-                            light_image=self.view.image_protection_off, size=(30, 30)
-                        ),
-                        require_redraw=True,
-                        state="disabled",
-                    )
-                    self.pbar_time_until_break.set(0)
+                renderer.set_value(self.pbar_time_until_break, 0)
+                renderer.configure(self.btn_take_break, state="disabled")
+                renderer.configure(self.lbl_time_until_break, text="Time until break: ∞ : ∞ : ∞")
+                renderer.configure(
+                    self.btn_change_suspended_state,
+                    text="Protection off",
+                    image=image_cache.get_ctk_image(ImgFiles.protection_off, (30, 30)),
+                    require_redraw=True,
+                    state="disabled",
+                )
 
             case StepType.suspended_mode:
-                if self.btn_take_break.cget("state") != "disabled":
-                    self.btn_take_break.configure(state="disabled")
-
-                    self.btn_change_suspended_state.configure(
-                        text="Protection suspended",
-                        text_color="Tomato",
-                        image=customtkinter.CTkImage(
-                            light_image=self.view.image_protection_suspended, size=(30, 30)
-                        ),
-                        require_redraw=True,
-                    )
-                self.lbl_time_until_break.configure(
-                    text=f"Time until normal mode: {model.current_state.current_step_duration - model.current_state.current_step_elapsed_time}"
+                renderer.set_value(self.pbar_time_until_break, round(snapshot.work_progress, 3))
+                renderer.configure(self.btn_take_break, state="disabled")
+                renderer.configure(
+                    self.btn_change_suspended_state,
+                    text="Protection suspended",
+                    text_color="Tomato",
+                    image=image_cache.get_ctk_image(ImgFiles.protection_suspended, (30, 30)),
+                    require_redraw=True,
+                    state="normal",
+                )
+                renderer.configure(
+                    self.lbl_time_until_break,
+                    text=f"Time until normal mode: {snapshot.step_remaining_time}",
                 )
             case _:
-                self.lbl_time_until_break.configure(
-                    text=f"Time until break: {model.remaining_working_time_to_display}"
+                renderer.set_value(self.pbar_time_until_break, round(snapshot.work_progress, 3))
+                renderer.configure(
+                    self.lbl_time_until_break,
+                    text=f"Time until break: {snapshot.time_until_break}",
                 )
-                self.btn_change_suspended_state.configure(
+                renderer.configure(
+                    self.btn_change_suspended_state,
                     text="Protection active",
                     text_color="GreenYellow",
-                    image=customtkinter.CTkImage(
-                        light_image=self.view.image_protection_active, size=(30, 30)
-                    ),
+                    image=image_cache.get_ctk_image(ImgFiles.protection_active, (30, 30)),
                     require_redraw=True,
+                    state="normal",
                 )
-                if self.btn_take_break.cget("state") != "normal":
-                    self.btn_take_break.configure(state="normal")
-
-                if self.btn_change_suspended_state.cget("state") != "normal":
-                    self.btn_change_suspended_state.configure(state="normal")
+                renderer.configure(self.btn_take_break, state="normal")
@@ -0,0 +1,112 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import time
+
+import pytest
+
+from src.windows.animation import FadeAnimation
+
+
+class FakeWnd:
+    """Window with after() callbacks executed manually by test"""
+
+    def __init__(self):
+        self.alpha_values = []
+        self.callbacks = {}
+        self.next_after_id = 0
+
+    def attributes(self, name, value):
+        self.alpha_values.append(value)
+
+    def after(self, delay_ms, callback):
+        self.next_after_id += 1
+        after_id = f"after#{self.next_after_id}"
+        self.callbacks[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.callbacks[after_id]
+
+    def run_next_callback(self):
+        after_id = next(iter(self.callbacks))
+        self.callbacks.pop(after_id)()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now_s = 0.0
+
+    monkeypatch.setattr(time, "monotonic", lambda: Clock.now_s)
+    monkeypatch.setattr(FadeAnimation, "enabled", True)
+    monkeypatch.setattr(FadeAnimation, "duration_ms", 600)
+    return Clock
+
+
+def test_fade_in_is_not_blocking(clock):
+    wnd = FakeWnd()
+    fade = FadeAnimation(wnd)
+    finished = []
+
+    fade.fade_in(on_finished=lambda: finished.append(True))
+    assert fade.is_running and not finished
+
+    frames_count = 0
+    while wnd.callbacks:
+        clock.now_s += 0.2
+        wnd.run_next_callback()
+        frames_count += 1
+
+    assert frames_count == 3
+    assert not fade.is_running and finished == [True]
+    assert fade.alpha == 1
+    assert wnd.callbacks == {}
+
+
+def test_fade_is_reversed_midway(clock):
+    wnd = FakeWnd()
+    fade = FadeAnimation(wnd)
+    withdrawn = []
+
+    fade.fade_in(on_finished=lambda: withdrawn.append(False))
+    clock.now_s += 0.3
+    wnd.run_next_callback()
+    assert fade.alpha == pytest.approx(0.5)
+
+    fade.fade_out(on_finished=lambda: withdrawn.append(True))
+    clock.now_s += 0.3
+    wnd.run_next_callback()
+
+    assert fade.alpha == 0
+    assert withdrawn == [True]
+    assert wnd.callbacks == {}
+
+
+def test_disabled_fade_sets_alpha_at_once(clock, monkeypatch):
+    monkeypatch.setattr(FadeAnimation, "enabled", False)
+    wnd = FakeWnd()
+    fade = FadeAnimation(wnd)
+    finished = []
+
+    fade.fade_in(on_finished=lambda: finished.append(True))
+
+    assert wnd.alpha_values == [1]
+    assert finished == [True]
+    assert wnd.callbacks == {}
+
+
+def test_alpha_is_set_at_once_and_running_fade_is_cancelled(clock):
+    wnd = FakeWnd()
+    fade = FadeAnimation(wnd)
+    finished = []
+
+    fade.fade_in(on_finished=lambda: finished.append(True))
+    clock.now_s += 0.3
+    wnd.run_next_callback()
+    fade.set_alpha(1)
+
+    assert fade.alpha == 1
+    assert not fade.is_running and finished == []
+    assert wnd.callbacks == {}
@@ -0,0 +1,106 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import dataclasses
+import datetime
+import itertools
+import time
+
+import pytest
+
+from src.states import ModelSnapshot, StepType
+from src.windows.break_countdown import BreakCountdownDisplay, get_break_countdown
+from src.windows.render import WidgetRenderer
+
+BREAK_SNAPSHOT = ModelSnapshot(
+    step_type=StepType.break_mode,
+    step_duration=datetime.timedelta(minutes=15),
+    step_elapsed_time=datetime.timedelta(0),
+    step_remaining_time=datetime.timedelta(minutes=15),
+    time_until_break=datetime.timedelta(0),
+    work_progress=1,
+    protection_status="on",
+    work_duration=45,
+    break_duration=15,
+    sounds="on",
+    notifications="on",
+    light_break_window="on",
+)
+
+
+def make_break_snapshot(elapsed_s: int) -> ModelSnapshot:
+    return dataclasses.replace(
+        BREAK_SNAPSHOT,
+        step_elapsed_time=datetime.timedelta(seconds=elapsed_s),
+        step_remaining_time=BREAK_SNAPSHOT.step_duration - datetime.timedelta(seconds=elapsed_s),
+    )
+
+
+def test_countdown_with_interval_of_second_shows_each_second():
+    progress, text = get_break_countdown(make_break_snapshot(90))
+
+    assert progress == pytest.approx(0.1)
+    assert text == "Remaining break time: 0:13:30"
+
+
+def test_countdown_is_changed_once_per_update_interval():
+    countdowns = {get_break_countdown(make_break_snapshot(elapsed_s), 10) for elapsed_s in range(15 * 60)}
+
+    assert len(countdowns) == 15 * 6
+    assert get_break_countdown(make_break_snapshot(0), 10) == (0, "Remaining break time: 0:15:00")
+    assert get_break_countdown(make_break_snapshot(15), 10) == (
+        pytest.approx(10 / 900),
+        "Remaining break time: 0:14:50",
+    )
+
+
+class FakeWnd:
+    """Window with after() callbacks executed by run_callbacks()"""
+
+    def __init__(self):
+        self.alpha_values = []
+        self.callbacks = []
+
+    def attributes(self, name, value):
+        self.alpha_values.append(value)
+
+    def after(self, delay_ms, callback):
+        self.callbacks.append(callback)
+        return f"after#{len(self.callbacks)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run_callbacks(self):
+        while self.callbacks:
+            self.callbacks.pop(0)()
+
+
+class FakeWidget:
+    def set(self, value):
+        pass
+
+
+@pytest.mark.parametrize("light_mode, widget_updates_count", [(False, 2 * 15 * 60), (True, 2 * 15 * 6)])
+def test_display_redraws_in_full_and_light_mode(monkeypatch, light_mode, widget_updates_count):
+    # each frame of fade is drawn 0.1 s after the previous one
+    monkeypatch.setattr(time, "monotonic", itertools.count(step=0.1).__next__)
+    wnd = FakeWnd()
+    renderer = WidgetRenderer("wnd_break_test")
+    display = BreakCountdownDisplay(wnd, renderer, FakeWidget(), FakeWidget(), 10)
+    display.light_mode = light_mode
+    hidden_calls = []
+
+    display.show()
+    wnd.run_callbacks()
+    for elapsed_s in range(15 * 60):
+        display.render(make_break_snapshot(elapsed_s))
+    display.hide(on_hidden=lambda: hidden_calls.append(True))
+    wnd.run_callbacks()
+
+    assert renderer.applied_count == widget_updates_count
+    assert wnd.alpha_values[-1] == 0
+    assert (len(wnd.alpha_values) == 2) is light_mode
+    assert hidden_calls == [True]
+    assert display.shows_background is not light_mode
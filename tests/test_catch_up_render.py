@@ -0,0 +1,37 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+from src.windows.catch_up_render import CatchUpRenderMixin
+
+
+class RecordingWindow(CatchUpRenderMixin):
+    def __init__(self):
+        self.rendered_snapshots = []
+
+    def update(self, snapshot):
+        self._update_snapshot(snapshot)
+
+    def show(self):
+        self._show_latest_snapshot()
+
+    def hide(self):
+        self.is_visible = False
+
+    def _render(self, snapshot):
+        self.rendered_snapshots.append(snapshot)
+
+
+def test_hidden_window_renders_only_the_latest_snapshot_on_showing():
+    window = RecordingWindow()
+    window.show()
+    assert window.rendered_snapshots == []
+
+    window.update("snapshot_1")
+    window.hide()
+    for snapshot in ("snapshot_2", "snapshot_3"):
+        window.update(snapshot)
+    assert window.rendered_snapshots == ["snapshot_1"]
+
+    window.show()
+    assert window.rendered_snapshots == ["snapshot_1", "snapshot_3"]
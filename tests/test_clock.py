@@ -0,0 +1,37 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import threading
+
+from src.clock import VirtualClock
+
+
+def test_virtual_clock_advances_on_wait_timeout():
+    clock = VirtualClock(start_time_s=10)
+    event = threading.Event()
+
+    assert clock.wait(event, 2.5) is False
+    clock.advance(1)
+
+    assert clock.now() == 13.5
+    assert clock.waits_count == 1
+
+
+def test_virtual_clock_does_not_advance_when_event_is_set():
+    clock = VirtualClock()
+    event = threading.Event()
+    event.set()
+
+    assert clock.wait(event, 60) is True
+    assert clock.wait(event, None) is True
+    assert clock.now() == 0
+
+
+def test_virtual_clock_keeps_integer_nanoseconds():
+    clock = VirtualClock()
+    for _ in range(1000):
+        clock.advance(0.001)
+
+    assert clock.now_ns() == 1_000_000_000
+    assert clock.now() == 1
@@ -0,0 +1,195 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import dataclasses
+import datetime
+import threading
+
+import pytest
+
+from src.clock import VirtualClock
+from src.controller import Controller
+from src.model import Model
+from src.settings import UserSettingsData
+from src.states import StepType
+from src.view_protocol import NullView, RecordingView
+
+SIMULATED_HOUR_S = 3600
+SIMULATED_WEEK_S = 7 * 24 * SIMULATED_HOUR_S
+
+
+def run_simulation(tmp_path, view: NullView, duration_s: float) -> Model:
+    clock = VirtualClock()
+    controller = Controller(clock)
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+    controller.set_model(model)
+    model.set_view(view)
+
+    controller.main_loop(until_time_s=duration_s)
+    return model
+
+
+def test_wakeups_per_hour_with_hidden_windows(tmp_path):
+    model = run_simulation(tmp_path, RecordingView(countdown_visible=False), SIMULATED_HOUR_S)
+
+    # default settings give one full cycle per hour: every minute of work and break plus notifications
+    assert model.wakeups_count <= SIMULATED_HOUR_S / model.tray_refresh_period_s + 5
+    assert model.current_state.current_step_type == StepType.work_mode
+
+
+def test_tray_refresh_period_follows_title_granularity(tmp_path):
+    clock = VirtualClock()
+    controller = Controller(clock)
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+    model.settings.system_settings.tray_title_granularity_s = 300
+    controller.set_model(model)
+    model.set_view(RecordingView(countdown_visible=False))
+
+    controller.main_loop(until_time_s=SIMULATED_HOUR_S)
+    assert model.tray_refresh_period_s == 300
+    assert model.wakeups_count <= SIMULATED_HOUR_S / 300 + 5
+
+
+def test_wakeups_per_hour_with_visible_countdown(tmp_path):
+    model = run_simulation(tmp_path, RecordingView(countdown_visible=True), SIMULATED_HOUR_S)
+
+    assert SIMULATED_HOUR_S - 5 <= model.wakeups_count <= SIMULATED_HOUR_S
+
+
+def test_simulated_week_of_cycles(tmp_path):
+    view = RecordingView(countdown_visible=False)
+    model = run_simulation(tmp_path, view, SIMULATED_WEEK_S)
+
+    # default settings give one full cycle per hour without drift of time
+    assert model.clock.now() == SIMULATED_WEEK_S
+    assert model.current_state.current_step_type == StepType.work_mode
+    assert model.wakeups_count <= SIMULATED_WEEK_S / model.tray_refresh_period_s + 5 * 24 * 7
+    assert len(view.notifications) >= 24 * 7
+    assert view.calls_count["prepare_wnd_break"] == 24 * 7
+
+
+class SpuriousWakeupsClock(VirtualClock):
+    """Virtual clock, which wakes up the first waits without passing of time"""
+
+    def __init__(self, spurious_wakeups_count: int):
+        super().__init__()
+        self.spurious_wakeups_left = spurious_wakeups_count
+
+    def wait(self, event: threading.Event, timeout: float | None) -> bool:
+        if self.spurious_wakeups_left > 0:
+            self.spurious_wakeups_left -= 1
+            self.waits_count += 1
+            return True
+        return super().wait(event, timeout)
+
+
+def test_snapshot_is_published_to_views(tmp_path):
+    view = RecordingView()
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=VirtualClock())
+    model.set_view(view)
+
+    snapshot = view.last_snapshot
+    assert snapshot is model.snapshot
+    assert snapshot.step_type == StepType.work_mode
+    assert snapshot.step_elapsed_time == datetime.timedelta(seconds=0)
+    assert snapshot.time_until_break == datetime.timedelta(minutes=45)
+    assert snapshot.work_progress == 0
+    assert snapshot.work_duration == 45
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.work_progress = 1
+
+
+def test_unchanged_snapshot_is_not_sent_to_views(tmp_path):
+    wnd_status_updates_counts = []
+    for clock in (VirtualClock(), SpuriousWakeupsClock(spurious_wakeups_count=10)):
+        view = RecordingView()
+        model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+        model.set_view(view)
+        model.wait_for_current_step_is_ended()
+        wnd_status_updates_counts.append(view.calls_count["update_wnd_status"])
+
+    assert wnd_status_updates_counts[0] == wnd_status_updates_counts[1]
+
+
+def test_posted_command_is_executed_at_once_by_waiting_loop(tmp_path):
+    clock = VirtualClock()
+    view = RecordingView()
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+    model.set_view(view)
+
+    model.post_command(model.set_step, StepType.break_mode)
+    assert model.current_state.current_step_type == StepType.work_mode
+    model.wait_for_current_step_is_ended()
+
+    # break is started at the first wakeup and the loop waits for its end
+    assert model.current_state.current_step_type == StepType.break_mode
+    assert clock.now() == 15 * 60
+
+
+def test_off_and_suspended_modes_wait_without_periodic_wakeups(tmp_path):
+    clock = VirtualClock()
+    view = RecordingView()
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+    model.set_view(view)
+    model.set_step(StepType.off_mode)
+    waiting_thread = threading.Thread(target=model.wait_for_current_step_is_ended)
+    waiting_thread.start()
+
+    # off mode waits for user without timeout, so virtual time does not pass
+    threading.Event().wait(0.1)
+    assert waiting_thread.is_alive()
+    assert clock.waits_count == 1
+    assert clock.now() == 0
+
+    model.post_command(model.switch_suspended_state)
+    waiting_thread.join(timeout=5)
+
+    # one wakeup by command and one at the end of suspending
+    assert not waiting_thread.is_alive()
+    assert model.wakeups_count == 2
+    assert clock.now() == 60 * 60
+    assert model.current_state.current_step_type == StepType.suspended_mode
+
+
+@pytest.mark.parametrize("light_break_window, max_wakeups_count", [("off", 15 * 60), ("on", 15 * 60 // 10)])
+def test_break_wakeups_with_light_break_window(tmp_path, light_break_window, max_wakeups_count):
+    clock = VirtualClock()
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=clock)
+    model.settings.user_settings.light_break_window = light_break_window
+    model.set_view(RecordingView(countdown_visible=True))
+    model.set_step(StepType.break_mode)
+
+    model.wait_for_current_step_is_ended()
+
+    # light break window changes the shown time once per update interval, so the model wakes up as rarely
+    assert clock.now() == 15 * 60
+    assert max_wakeups_count - 2 <= model.wakeups_count <= max_wakeups_count
+
+
+def test_failed_command_does_not_stop_others(tmp_path):
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=VirtualClock())
+    model.set_view(RecordingView())
+
+    model.post_command(int, "not a number")
+    model.post_command(model.switch_suspended_state)
+
+    assert model.execute_commands() == 2
+    assert model.current_state.current_step_type == StepType.suspended_mode
+
+
+def test_steps_table_is_updated_in_place(tmp_path):
+    model = Model(settings_file=str(tmp_path / "settings.json"))
+    model.set_view(RecordingView())
+    steps_table = model.steps_table
+    step_data_ids = [id(step_data) for step_data in steps_table]
+
+    for work_duration in range(1, 21):
+        user_settings = UserSettingsData()
+        user_settings.work_duration = work_duration
+        model.apply_new_user_settings(user_settings)
+
+    assert model.steps_table is steps_table
+    assert [id(step_data) for step_data in model.steps_table] == step_data_ids
+    assert [step_data.step_type for step_data in model.steps_table] == list(StepType)
+    assert model.steps_table[StepType.work_mode].step_duration_td.total_seconds() == 20 * 60 - 60
@@ -0,0 +1,111 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import asyncio
+import threading
+
+from src.clock import VirtualClock
+from src.notifications import NotificationDispatcher
+from src.states import StepType
+
+
+class FakeNotifier:
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.notifications = []
+        self.shown_event = threading.Event()
+
+    def __call__(self, title, text):
+        if self.delay_s:
+            threading.Event().wait(self.delay_s)
+        if title == "fail":
+            raise RuntimeError("notification can not be shown")
+        self.notifications.append((title, text))
+        self.shown_event.set()
+
+
+def make_dispatcher(notifier, clock=None, current_step_type=StepType.work_mode, **kwargs):
+    clock = clock if clock is not None else VirtualClock()
+    return NotificationDispatcher(notifier, lambda: current_step_type, clock, **kwargs)
+
+
+async def run_dispatcher(dispatcher, duration_s: float = 0.05) -> None:
+    task = asyncio.create_task(dispatcher.run())
+    await asyncio.sleep(duration_s)
+    task.cancel()
+
+
+def test_duplicates_within_window_are_ignored():
+    notifier = FakeNotifier()
+    clock = VirtualClock()
+    dispatcher = make_dispatcher(notifier, clock, current_step_type=StepType.off_mode, dedup_window_s=30)
+
+    async def scenario():
+        assert dispatcher.submit("Protection is off!", "Attention!")
+        assert not dispatcher.submit("Protection is off!", "Attention!")
+        clock.advance(30)
+        assert dispatcher.submit("Protection is off!", "Attention!")
+        await run_dispatcher(dispatcher)
+
+    asyncio.run(scenario())
+
+    assert notifier.notifications == [("Protection is off!", "Attention!")] * 2
+    assert dispatcher.deduplicated_count == 1
+    assert dispatcher.shown_count == 2
+    assert dispatcher.last_latency_s is not None
+
+
+def test_notification_about_ended_step_is_dropped():
+    notifier = FakeNotifier()
+    dispatcher = make_dispatcher(notifier, current_step_type=StepType.break_mode)
+
+    async def scenario():
+        dispatcher.submit("Break will start in 5 seconds!", "Attention!", StepType.work_notified_2)
+        dispatcher.submit("Break", "Attention!", StepType.break_mode)
+        await run_dispatcher(dispatcher)
+
+    asyncio.run(scenario())
+
+    assert notifier.notifications == [("Break", "Attention!")]
+    assert dispatcher.stale_count == 1
+
+
+def test_oldest_notification_is_dropped_when_queue_is_full():
+    notifier = FakeNotifier()
+    dispatcher = make_dispatcher(notifier, maxsize=2)
+
+    async def scenario():
+        for i in range(4):
+            dispatcher.submit(f"title {i}", "text")
+        assert len(dispatcher) == 2
+        await run_dispatcher(dispatcher)
+
+    asyncio.run(scenario())
+
+    assert notifier.notifications == [("title 2", "text"), ("title 3", "text")]
+    assert dispatcher.dropped_count == 2
+
+
+def test_slow_backend_does_not_block_event_loop():
+    notifier = FakeNotifier(delay_s=0.3)
+    dispatcher = make_dispatcher(notifier)
+    ticks = []
+
+    async def scenario():
+        task = asyncio.create_task(dispatcher.run())
+        dispatcher.submit("fail", "text")
+        dispatcher.submit("title", "text")
+        for _ in range(10):
+            ticks.append(len(notifier.notifications))
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(notifier.shown_event.wait, 5)
+        task.cancel()
+
+    asyncio.run(scenario())
+
+    # loop is running while backend shows notifications
+    assert ticks == [0] * 10
+    assert notifier.notifications == [("title", "text")]
+    assert dispatcher.failed_count == 1
+    assert dispatcher.max_latency_s >= 0.3
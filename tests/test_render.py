@@ -0,0 +1,56 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+from src.windows.render import WidgetRenderer
+
+
+class FakeWidget:
+    def __init__(self):
+        self.configure_calls = []
+        self.set_calls = []
+
+    def configure(self, **properties):
+        self.configure_calls.append(properties)
+
+    def set(self, value):
+        self.set_calls.append(value)
+
+
+def test_only_changed_properties_are_configured():
+    renderer = WidgetRenderer("wnd_test")
+    widget = FakeWidget()
+    image = object()
+
+    for _ in range(3):
+        renderer.configure(widget, text="Protection active", image=image, require_redraw=True)
+    renderer.configure(widget, text="Protection suspended", image=image, require_redraw=True)
+
+    assert widget.configure_calls == [
+        {"require_redraw": True, "text": "Protection active", "image": image},
+        {"require_redraw": True, "text": "Protection suspended"},
+    ]
+    assert renderer.applied_count == 2
+    assert renderer.skipped_count == 2
+
+
+def test_values_are_set_only_when_changed():
+    renderer = WidgetRenderer("wnd_test")
+    widget = FakeWidget()
+
+    for value in (0, 0, 0.5, 0.5, 1):
+        renderer.set_value(widget, value)
+
+    assert widget.set_calls == [0, 0.5, 1]
+    assert renderer.skipped_count == 2
+
+
+def test_forgotten_values_are_rendered_again():
+    renderer = WidgetRenderer("wnd_test")
+    widget = FakeWidget()
+
+    renderer.configure(widget, text="Time until break: 0:44:00")
+    renderer.forget()
+    renderer.configure(widget, text="Time until break: 0:44:00")
+
+    assert len(widget.configure_calls) == 2
@@ -0,0 +1,78 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("customtkinter")
+
+from src.resourses import ImageCache, ProgressRingIcons
+
+
+@pytest.fixture
+def img_dir(tmp_path):
+    for name in ("a.png", "b.png", "c.png"):
+        Image.new("RGBA", (10, 10)).save(tmp_path / name)
+    return tmp_path
+
+
+def test_images_are_loaded_on_first_use(img_dir):
+    image_cache = ImageCache(str(img_dir), memory_limit_b=1024 * 1024)
+    assert image_cache.memory_used_b == 0
+
+    image = image_cache.get_image("a.png")
+
+    assert image.size == (10, 10)
+    assert image_cache.get_image("a.png") is image
+    assert image_cache.misses_count == 1
+
+
+def test_failed_load_is_cached(img_dir):
+    image_cache = ImageCache(str(img_dir), memory_limit_b=1024 * 1024)
+
+    assert image_cache.get_image("missing.png") is None
+    assert image_cache.get_ctk_image("missing.png", (30, 30)) is None
+    assert image_cache.get_image("missing.png") is None
+
+    # the file is opened only for the first request
+    assert image_cache.misses_count == 2
+    assert image_cache.hits_count == 1
+
+
+def test_resized_variants_are_memoized(img_dir):
+    image_cache = ImageCache(str(img_dir), memory_limit_b=1024 * 1024)
+
+    ctk_image = image_cache.get_ctk_image("a.png", (30, 30))
+    # cold request is counted once, although decoded image is loaded too
+    assert image_cache.misses_count == 1
+
+    assert image_cache.get_ctk_image("a.png", (30, 30)) is ctk_image
+    assert image_cache.get_ctk_image("a.png", (25, 25)) is not ctk_image
+    assert (image_cache.hits_count, image_cache.misses_count) == (1, 2)
+
+
+def test_least_recently_used_images_are_evicted(img_dir):
+    # limit is enough for two decoded 10x10 RGBA images
+    image_cache = ImageCache(str(img_dir), memory_limit_b=800)
+
+    image_a = image_cache.get_image("a.png")
+    image_cache.get_image("b.png")
+    image_cache.get_image("a.png")
+    image_cache.get_image("c.png")
+
+    assert image_cache.memory_used_b == 800
+    assert image_cache.get_image("a.png") is image_a
+    misses_count = image_cache.misses_count
+    image_cache.get_image("b.png")
+    assert image_cache.misses_count == misses_count + 1
+
+
+def test_progress_ring_frames_are_rendered_once():
+    progress_icons = ProgressRingIcons(Image.new("RGBA", (32, 32)), steps=10)
+
+    assert progress_icons.frame_index(0) == 0
+    assert progress_icons.frame_index(0.54) == 5
+    assert progress_icons.frame_index(1.5) == 10
+    assert progress_icons.get_frame(5) is progress_icons.get_frame(5)
+    assert progress_icons.get_frame(0).getpixel((16, 0)) != progress_icons.get_frame(10).getpixel((16, 0))
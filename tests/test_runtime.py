@@ -0,0 +1,151 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import datetime
+import json
+import threading
+import time
+
+import pytest
+
+from src.clock import VirtualClock
+from src.controller import Controller
+from src.model import Model
+from src.settings import UserSettingsData
+from src.states import StepType
+from src.view_protocol import RecordingView
+
+
+class BreakWaitingView(RecordingView):
+    def __init__(self):
+        super().__init__()
+        self.break_started_event = threading.Event()
+
+    def update_wnd_break(self, snapshot):
+        super().update_wnd_break(snapshot)
+        if snapshot.step_type == StepType.break_mode:
+            self.break_started_event.set()
+
+
+def make_controller(tmp_path, view: RecordingView) -> Controller:
+    controller = Controller()
+    model = Model(settings_file=str(tmp_path / "settings.json"), clock=controller.clock)
+    controller.set_model(model)
+    model.set_view(view)
+    return controller
+
+
+def test_runtime_executes_commands_and_stops(tmp_path):
+    view = BreakWaitingView()
+    controller = make_controller(tmp_path, view)
+    controller.start()
+    assert controller.runtime.is_running
+
+    controller.set_step(StepType.break_mode)
+    assert view.break_started_event.wait(timeout=5)
+
+    assert controller.stop(timeout_s=5)
+    assert not controller.runtime.is_running
+    assert controller.runtime.shutdown_latency_s < 1
+
+
+class FailingView(BreakWaitingView):
+    def __init__(self):
+        super().__init__()
+        self.work_after_break_event = threading.Event()
+        self.is_broken = False
+
+    def is_countdown_visible(self):
+        # it is called by every poll of step
+        if self.is_broken:
+            raise RuntimeError("view is broken")
+        return super().is_countdown_visible()
+
+    def update_wnd_break(self, snapshot):
+        super().update_wnd_break(snapshot)
+        if self.break_started_event.is_set() and snapshot.step_type == StepType.work_mode:
+            self.work_after_break_event.set()
+
+
+def test_runtime_steps_continue_after_view_error(tmp_path):
+    view = FailingView()
+    controller = make_controller(tmp_path, view)
+    controller.model.steps_table[StepType.break_mode].step_duration_td = datetime.timedelta(seconds=0.2)
+    view.is_broken = True
+    controller.start()
+
+    controller.set_step(StepType.break_mode)
+
+    # failed polls are logged and repeated, break still ends by timeline
+    assert view.break_started_event.wait(timeout=5)
+    assert view.work_after_break_event.wait(timeout=5)
+    assert controller.stop(timeout_s=5)
+
+
+def test_runtime_dispatches_notifications_and_saves_settings_before_stop(tmp_path):
+    view = RecordingView()
+    controller = make_controller(tmp_path, view)
+    controller.start()
+
+    user_settings = UserSettingsData()
+    user_settings.work_duration = 30
+    controller.apply_view_user_settings(user_settings)
+    controller.switch_suspended_state()
+    # notifications are shown asynchronously by worker thread
+    deadline_s = time.monotonic() + 5
+    while not view.notifications and time.monotonic() < deadline_s:
+        time.sleep(0.01)
+    assert controller.stop(timeout_s=5)
+
+    assert ("Eyes Guard protection suspended!", "Attention!") in view.notifications
+    assert controller.runtime.notifications.shown_count == 1
+    saved_settings = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert saved_settings["work_duration"] == 30
+
+
+def test_runtime_does_not_start_with_virtual_clock(tmp_path):
+    controller = Controller(clock=VirtualClock())
+    controller.set_model(Model(settings_file=str(tmp_path / "settings.json"), clock=controller.clock))
+
+    with pytest.raises(TypeError):
+        controller.runtime.start()
+    assert not controller.runtime.is_running
+
+
+def test_runtime_writes_burst_of_settings_changes_once(tmp_path):
+    controller = make_controller(tmp_path, RecordingView())
+    controller.runtime.SETTINGS_SAVE_DELAY_S = 0.05
+    controller.start()
+
+    for work_duration in range(20, 30):
+        user_settings = UserSettingsData()
+        user_settings.work_duration = work_duration
+        controller.apply_view_user_settings(user_settings)
+    settings = controller.model.settings
+    for _ in range(100):
+        if settings.writes_count > 0:
+            break
+        time.sleep(0.01)
+    assert controller.stop(timeout_s=5)
+
+    assert settings.writes_count == 1
+    saved_settings = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert saved_settings["work_duration"] == 29
+
+
+def test_runtime_applies_settings_file_changed_by_other_program(tmp_path):
+    view = RecordingView()
+    controller = make_controller(tmp_path, view)
+    controller.model.settings.system_settings.settings_file_poll_period_s = 0.01
+    controller.start()
+
+    (tmp_path / "settings.json").write_text('{"work_duration": 20}', encoding="utf-8")
+    for _ in range(500):
+        if controller.model.user_settings.work_duration == 20:
+            break
+        time.sleep(0.01)
+    assert controller.stop(timeout_s=5)
+
+    assert controller.model.user_settings.work_duration == 20
+    assert view.last_snapshot.work_duration == 20
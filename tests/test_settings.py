@@ -2,6 +2,7 @@ import sys
 
 sys.path.insert(0, "./src")
 
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -9,7 +10,7 @@ from pydantic import ValidationError
 
 from src.settings import Settings, UserSettingsData
 
-settings_default_str = "{'break_duration': 15, 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 45}"
+settings_default_str = "{'break_duration': 15, 'light_break_window': 'off', 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 45}"
 
 
 @pytest.mark.parametrize(
@@ -17,23 +18,23 @@ settings_default_str = "{'break_duration': 15, 'notifications': 'on', 'protectio
     [
         (
             "tests/data/settings_valid_min_values.json",
-            "{'break_duration': 1, 'notifications': 'off', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 1}",
+            "{'break_duration': 1, 'light_break_window': 'off', 'notifications': 'off', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 1}",
         ),
         (
             "tests/data/settings_valid_mean_values.json",
-            "{'break_duration': 50, 'notifications': 'on', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 50}",
+            "{'break_duration': 50, 'light_break_window': 'off', 'notifications': 'on', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 50}",
         ),
         (
             "tests/data/settings_valid_max_values.json",
-            "{'break_duration': 100, 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 100}",
+            "{'break_duration': 100, 'light_break_window': 'off', 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 100}",
         ),
         (
             "tests/data/settings_valid_empty.json",
-            "{'break_duration': 15, 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 45}",
+            "{'break_duration': 15, 'light_break_window': 'off', 'notifications': 'on', 'protection_status': 'on', 'sounds': 'on', 'work_duration': 45}",
         ),
         (
             "tests/data/settings_valid_no_param.json",
-            "{'break_duration': 15, 'notifications': 'off', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 1}",
+            "{'break_duration': 15, 'light_break_window': 'off', 'notifications': 'off', 'protection_status': 'on', 'sounds': 'off', 'work_duration': 1}",
         ),
     ],
 )
@@ -73,7 +74,7 @@ def test_write_default_user_settings_to_file():
     written_file_content = Path(file_to_write).read_text()
     print(f"Written file content = {written_file_content}")
 
-    expected_file_content = '{\n    "work_duration": 45,\n    "break_duration": 15,\n    "sounds": "on",\n    "notifications": "on",\n    "protection_status": "on"\n}'
+    expected_file_content = '{\n    "work_duration": 45,\n    "break_duration": 15,\n    "sounds": "on",\n    "notifications": "on",\n    "protection_status": "on",\n    "light_break_window": "off"\n}'
     assert written_file_content == expected_file_content, "Written content and expected content are not same!"
 
 
@@ -93,5 +94,70 @@ def test_write_invalid_settings_to_file():
 
     written_file_content = Path(file_to_write).read_text()
     print(f"Written file content = {written_file_content}")
-    expected_file_content = '{\n    "work_duration": 45,\n    "break_duration": 15,\n    "sounds": "on",\n    "notifications": "on",\n    "protection_status": "on"\n}'
+    expected_file_content = '{\n    "work_duration": 45,\n    "break_duration": 15,\n    "sounds": "on",\n    "notifications": "on",\n    "protection_status": "on",\n    "light_break_window": "off"\n}'
     assert written_file_content == expected_file_content, "Written content and expected content are not same!"
+
+
+def test_unchanged_settings_are_not_written_again(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings = Settings(str(settings_file))
+
+    for _ in range(3):
+        settings.apply_settings_from_ui(new_settings_data=UserSettingsData())
+
+    assert settings.writes_count == 1
+    assert settings.skipped_writes_count == 2
+    assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_settings_file_is_replaced_by_written_one(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text('{"work_duration": 30}', encoding="utf-8")
+    settings = Settings(str(settings_file))
+    user_settings = settings.get_settings_copy()
+    user_settings.break_duration = 10
+
+    settings.apply_settings_from_ui(new_settings_data=user_settings)
+
+    assert '"work_duration": 30' in settings_file.read_text(encoding="utf-8")
+    assert '"break_duration": 10' in settings_file.read_text(encoding="utf-8")
+    assert settings.writes_count == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_settings_file_is_read_only_after_change(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text('{"work_duration": 30}', encoding="utf-8")
+    settings = Settings(str(settings_file))
+
+    assert not settings.reload_settings_from_file()
+    assert settings.reads_count == 1
+
+    settings_file.write_text('{"work_duration": 25, "break_duration": 5}', encoding="utf-8")
+    assert settings.is_file_changed()
+    assert settings.reload_settings_from_file()
+    assert settings.user_settings.work_duration == 25
+    assert settings.user_settings.break_duration == 5
+    assert settings.reads_count == 2
+
+    # own writing is not a change of file
+    settings.apply_settings_from_ui(new_settings_data=settings.get_settings_copy())
+    assert not settings.is_file_changed()
+
+
+def test_invalid_settings_file_is_not_applied_on_reload(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    settings_file.write_text('{"work_duration": 30}', encoding="utf-8")
+    settings = Settings(str(settings_file))
+
+    settings_file.write_text('{"work_duration": 300}', encoding="utf-8")
+
+    assert not settings.reload_settings_from_file()
+    assert settings.user_settings.work_duration == 30
+
+
+def test_pydantic_is_not_imported_without_validation():
+    # fresh process, because pydantic is already imported by this module
+    code = "import sys; sys.path.insert(0, './src'); import model; print('pydantic' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
@@ -0,0 +1,40 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import asyncio
+
+import pytest
+
+from src.settings_watcher import SettingsFileWatcher
+
+
+async def wait_for_change_after_writing(watcher: SettingsFileWatcher, settings_file) -> None:
+    waiting = asyncio.create_task(watcher.wait_for_change())
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    settings_file.with_name("other.json").write_text("{}", encoding="utf-8")
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+
+    settings_file.write_text('{"work_duration": 30}', encoding="utf-8")
+    await asyncio.wait_for(waiting, timeout=5)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is available on Linux only")
+def test_watcher_wakes_up_on_settings_file_event(tmp_path):
+    settings_file = tmp_path / "settings.json"
+    watcher = SettingsFileWatcher(settings_file, poll_period_s=60)
+    assert watcher.uses_inotify
+    try:
+        asyncio.run(wait_for_change_after_writing(watcher, settings_file))
+    finally:
+        watcher.close()
+
+
+def test_watcher_without_inotify_wakes_up_periodically(tmp_path):
+    watcher = SettingsFileWatcher(tmp_path / "settings.json", poll_period_s=0.01, use_inotify=False)
+    assert not watcher.uses_inotify
+
+    asyncio.run(asyncio.wait_for(watcher.wait_for_change(), timeout=5))
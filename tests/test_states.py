@@ -0,0 +1,73 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import datetime
+
+from src.clock import VirtualClock
+from src.states import CurrentState, StepData, StepsTimeline, StepType
+
+
+def make_steps_data(durations_s: dict) -> tuple[StepData, ...]:
+    steps_data_list = []
+    for step_type in StepType:
+        duration_td = datetime.timedelta(seconds=durations_s.get(step_type, 0))
+        steps_data_list.append(StepData(step_type=step_type, step_duration_td=duration_td))
+    return tuple(steps_data_list)
+
+
+def test_steps_timeline_queries():
+    steps_data_list = make_steps_data(
+        {
+            StepType.off_mode: 3600,
+            StepType.work_mode: 2640,
+            StepType.work_notified_1: 55,
+            StepType.work_notified_2: 5,
+            StepType.break_mode: 900,
+        }
+    )
+    timeline = StepsTimeline.from_steps_data(steps_data_list)
+    remaining_td = datetime.timedelta(seconds=10)
+
+    assert timeline.time_until_break(StepType.work_mode, remaining_td) == datetime.timedelta(seconds=70)
+    assert timeline.time_until_break(StepType.work_notified_1, remaining_td) == datetime.timedelta(seconds=15)
+    assert timeline.time_until_break(StepType.work_notified_2, remaining_td) == remaining_td
+    assert timeline.time_until_break(StepType.off_mode, remaining_td) == datetime.timedelta(seconds=2710)
+    assert timeline.time_until_break(StepType.break_mode, remaining_td) == remaining_td
+
+    assert timeline.cycle_length(StepType.work_mode) == datetime.timedelta(seconds=2700)
+    assert timeline.cycle_length(StepType.off_mode) == datetime.timedelta(seconds=6300)
+
+    assert timeline.progress(StepType.work_mode, datetime.timedelta(seconds=2640)) == 0
+    assert timeline.progress(StepType.work_notified_2, datetime.timedelta(seconds=0)) == 1
+
+
+def test_steps_timeline_without_work_time():
+    timeline = StepsTimeline.from_steps_data(make_steps_data({}))
+
+    assert timeline.progress(StepType.work_mode, datetime.timedelta(seconds=0)) == 0
+
+
+def test_current_state_rounds_displayed_time_down_to_seconds():
+    clock = VirtualClock()
+    current_state = CurrentState(clock)
+    current_state.set_current_step_data(StepType.work_mode, datetime.timedelta(minutes=1))
+
+    clock.advance(2.75)
+    current_state.update_elapsed_time()
+
+    assert current_state.current_step_elapsed_time == datetime.timedelta(seconds=2)
+    assert current_state.current_step_remaining_time == datetime.timedelta(seconds=58)
+    assert current_state.current_step_elapsed_time_s == 2.75
+    assert current_state.current_step_remaining_time_s == 57.25
+
+    current_state.reset_elapsed_time()
+    current_state.update_elapsed_time()
+    assert current_state.current_step_remaining_time == datetime.timedelta(minutes=1)
+
+
+def test_current_state_has_no_dict():
+    current_state = CurrentState(VirtualClock())
+
+    assert not hasattr(current_state, "__dict__")
+    assert repr(current_state).startswith("CurrentState(")
@@ -0,0 +1,130 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import datetime
+
+from src.states import ModelSnapshot, StepType, round_up_time
+from src.tray_presenter import TrayPresenter
+
+
+class FakeTrayIcon:
+    def __init__(self):
+        self.assignments = []
+
+    def __setattr__(self, name, value):
+        if name != "assignments":
+            self.assignments.append((name, value))
+        super().__setattr__(name, value)
+
+
+class FakeProgressIcons:
+    steps = 4
+
+    def frame_index(self, progress):
+        return round(progress * self.steps)
+
+    def get_frame(self, index):
+        return f"frame {index}"
+
+
+def make_snapshot(step_type: StepType, remaining_s: int, work_progress: float = 0.0) -> ModelSnapshot:
+    remaining_time = datetime.timedelta(seconds=remaining_s)
+    return ModelSnapshot(
+        step_type=step_type,
+        step_duration=datetime.timedelta(minutes=45),
+        step_elapsed_time=datetime.timedelta(minutes=45) - remaining_time,
+        step_remaining_time=remaining_time,
+        time_until_break=remaining_time,
+        work_progress=work_progress,
+        protection_status="on",
+        work_duration=45,
+        break_duration=15,
+        sounds="on",
+        notifications="on",
+        light_break_window="off",
+    )
+
+
+def test_time_is_rounded_up_to_granularity():
+    assert round_up_time(datetime.timedelta(seconds=61), 60) == datetime.timedelta(minutes=2)
+    assert round_up_time(datetime.timedelta(seconds=60), 60) == datetime.timedelta(minutes=1)
+    assert round_up_time(datetime.timedelta(seconds=0), 60) == datetime.timedelta(0)
+    assert round_up_time(datetime.timedelta(seconds=61), 1) == datetime.timedelta(seconds=61)
+
+
+def test_tray_is_updated_only_when_minute_is_changed():
+    tray_icon = FakeTrayIcon()
+    presenter = TrayPresenter(tray_icon, get_icon=lambda name: name, title_granularity_s=60)
+
+    # snapshots of each second of 3 minutes, e.g. while status window is shown
+    for remaining_s in range(180, 0, -1):
+        presenter.update(make_snapshot(StepType.work_mode, remaining_s))
+
+    assert tray_icon.assignments == [
+        ("icon", "protection_active"),
+        ("title", "Time until break: 0:03:00"),
+        ("title", "Time until break: 0:02:00"),
+        ("title", "Time until break: 0:01:00"),
+    ]
+    assert presenter.icon_updates_count == 1
+    assert presenter.title_updates_count == 3
+    assert presenter.skipped_count == 177
+
+
+def test_icon_is_changed_on_step_transitions():
+    tray_icon = FakeTrayIcon()
+    presenter = TrayPresenter(
+        tray_icon,
+        get_icon=lambda name: name,
+        title_granularity_s=60,
+        now=lambda: datetime.datetime(2024, 1, 1, 12, 0, 30),
+    )
+
+    for step_type, remaining_s in (
+        (StepType.work_mode, 600),
+        (StepType.suspended_mode, 600),
+        (StepType.suspended_mode, 599),
+        (StepType.off_mode, 600),
+        (StepType.off_mode, 600),
+    ):
+        presenter.update(make_snapshot(step_type, remaining_s))
+
+    assert tray_icon.assignments == [
+        ("icon", "protection_active"),
+        ("title", "Time until break: 0:10:00"),
+        ("icon", "protection_suspended"),
+        ("title", "Protection suspended until 12:10"),
+        ("icon", "protection_off"),
+        ("title", "Protection off"),
+    ]
+
+
+def test_resume_time_follows_restarted_suspending():
+    tray_icon = FakeTrayIcon()
+    now = datetime.datetime(2024, 1, 1, 12, 0, 30)
+    presenter = TrayPresenter(tray_icon, get_icon=lambda name: name, now=lambda: now)
+
+    presenter.update(make_snapshot(StepType.suspended_mode, 600))
+    # resuming and suspending again are coalesced, so presenter gets only the new suspended snapshot
+    now = datetime.datetime(2024, 1, 1, 12, 5, 30)
+    presenter.update(make_snapshot(StepType.suspended_mode, 600))
+
+    assert tray_icon.assignments == [
+        ("icon", "protection_suspended"),
+        ("title", "Protection suspended until 12:10"),
+        ("title", "Protection suspended until 12:15"),
+    ]
+
+
+def test_progress_icons_are_switched_by_frames():
+    tray_icon = FakeTrayIcon()
+    presenter = TrayPresenter(
+        tray_icon, get_icon=lambda name: name, title_granularity_s=3600, progress_icons=FakeProgressIcons()
+    )
+
+    for progress_percent in range(0, 101):
+        presenter.update(make_snapshot(StepType.work_mode, 600, work_progress=progress_percent / 100))
+
+    icons = [value for name, value in tray_icon.assignments if name == "icon"]
+    assert icons == ["frame 0", "frame 1", "frame 2", "frame 3", "frame 4"]
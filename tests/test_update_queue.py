@@ -0,0 +1,103 @@
+import sys
+
+sys.path.insert(0, "./src")
+
+import threading
+
+from src.update_queue import CoalescingUpdateQueue
+
+
+class UpdatesRecorder:
+    def __init__(self):
+        self.drain_requests_count = 0
+        self.updates = []
+
+    def schedule_drain(self):
+        self.drain_requests_count += 1
+
+    def update(self, target, value):
+        self.updates.append((target, value))
+
+
+def test_updates_of_same_target_are_coalesced():
+    recorder = UpdatesRecorder()
+    update_queue = CoalescingUpdateQueue(schedule_drain=recorder.schedule_drain)
+
+    for value in range(10):
+        update_queue.put("wnd_status", recorder.update, "wnd_status", value)
+    update_queue.put("tray_icon", recorder.update, "tray_icon", 0)
+
+    assert len(update_queue) == 2
+    assert recorder.drain_requests_count == 1
+    assert update_queue.coalesced_count == 9
+
+    update_queue.drain()
+
+    assert recorder.updates == [("wnd_status", 9), ("tray_icon", 0)]
+    assert len(update_queue) == 0
+
+    update_queue.put("wnd_status", recorder.update, "wnd_status", 10)
+    assert recorder.drain_requests_count == 2
+
+
+def test_queue_is_bounded():
+    recorder = UpdatesRecorder()
+    update_queue = CoalescingUpdateQueue(schedule_drain=recorder.schedule_drain, maxsize=2)
+
+    for target in ("wnd_status", "wnd_break", "tray_icon"):
+        update_queue.put(target, recorder.update, target, 0)
+    update_queue.drain()
+
+    assert update_queue.dropped_count == 1
+    assert recorder.updates == [("wnd_break", 0), ("tray_icon", 0)]
+
+
+def test_failed_update_does_not_break_others():
+    recorder = UpdatesRecorder()
+    update_queue = CoalescingUpdateQueue(schedule_drain=recorder.schedule_drain)
+
+    def fail():
+        raise RuntimeError("redraw failed")
+
+    update_queue.put("wnd_status", fail)
+    update_queue.put("tray_icon", recorder.update, "tray_icon", 0)
+    update_queue.drain()
+
+    assert recorder.updates == [("tray_icon", 0)]
+
+
+def test_failed_drain_scheduling_is_requested_again():
+    recorder = UpdatesRecorder()
+
+    def schedule_drain_failing_once():
+        recorder.schedule_drain()
+        if recorder.drain_requests_count == 1:
+            raise RuntimeError("main thread is not in main loop")
+
+    update_queue = CoalescingUpdateQueue(schedule_drain=schedule_drain_failing_once)
+
+    update_queue.put("wnd_status", recorder.update, "wnd_status", 0)
+    update_queue.put("wnd_status", recorder.update, "wnd_status", 1)
+    assert recorder.drain_requests_count == 2
+
+    update_queue.drain()
+    assert recorder.updates == [("wnd_status", 1)]
+
+
+def test_updates_from_several_threads():
+    recorder = UpdatesRecorder()
+    update_queue = CoalescingUpdateQueue(schedule_drain=recorder.schedule_drain)
+
+    def put_updates(target):
+        for value in range(1000):
+            update_queue.put(target, recorder.update, target, value)
+
+    threads = [threading.Thread(target=put_updates, args=(f"wnd_{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    update_queue.drain()
+
+    assert sorted(recorder.updates) == [(f"wnd_{i}", 999) for i in range(4)]
+    assert update_queue.coalesced_count == 4 * 999